@@ -29,18 +29,22 @@ door_draw_options = {'linestyle': '--', 'marker': '|', 'markersize': 10}
 garage[0].draw_options = door_draw_options
 garage[1].draw_options = door_draw_options
 
+# The garage is stationary, so its door positions are the same at all times
+garage_left = garage.left_pos(0)
+garage_right = garage.right_pos(0)
+
 # Time range
 t_start = 0
 # End when the ladder totally clears the garage
-t_end = ladder.time_for_left_pos(garage.right_pos(0))
+t_end = ladder.time_for_left_pos(garage_right)
 # Time when the garage doors are opened/closd
-t_transition = ladder.time_for_left_pos(garage.left_pos(0))
+t_transition = ladder.time_for_left_pos(garage_left)
 
 # Whole period when each door is closed
 closed_draw_options = {'color': 'red', 'marker': '|', 'markersize': 10}
-left_closed = geom.Ray((1, 0), (t_transition, garage.left_pos(0)),
+left_closed = geom.Ray((1, 0), (t_transition, garage_left),
     draw_options=closed_draw_options)
-right_closed = geom.Ray((-1, 0), (t_transition, garage.right_pos(0)),
+right_closed = geom.Ray((-1, 0), (t_transition, garage_right),
     draw_options=closed_draw_options)
 
 # Exact event of closing/opening each door
@@ -56,9 +60,9 @@ open_event_draw_options = {
     'markersize': 10,
     'label': 'Open door',
 }
-left_close_event = geom.STVector(t_transition, garage.left_pos(t_transition),
+left_close_event = geom.STVector(t_transition, garage_left,
     draw_options=close_event_draw_options)
-right_open_event = geom.STVector(t_transition, garage.right_pos(t_transition),
+right_open_event = geom.STVector(t_transition, garage_right,
     draw_options=open_event_draw_options)
 
 # Synthesize the scene
@@ -80,30 +84,34 @@ p[0].show()
 
 # Animate the lab frame
 fps = 50
+# Save every clip with the same encoding so they can be glued together without
+# re-encoding
+save_options = {'writer': 'ffmpeg', 'codec': 'h264',
+    'extra_args': ['-pix_fmt', 'yuv420p']}
 current_time_color = 'cyan'
 lab_fname = '8-ladderparadox_stationary.mp4'
 anim_lab = vis.stanimate_with_worldline(scene, tlim=tlim, xlim=xlim,
     fps=fps, legend=True, legend_loc='upper left',
     title='The ladder paradox (stationary POV)',
     current_time_color=current_time_color)
-anim_lab.save(lab_fname)
+anim_lab.save(lab_fname, **save_options)
 # Animate the ladder frame
 ladder_fname = '8-ladderparadox_ladder.mp4'
 anim_ladder = vis.stanimate_with_worldline(geom.lorentz_transformed(scene, v),
     tlim=tlim, xlim=xlim, fps=fps, legend=True, legend_loc='upper right',
     title='The ladder paradox (ladder POV)',
     current_time_color=current_time_color)
-anim_ladder.save(ladder_fname)
+anim_ladder.save(ladder_fname, **save_options)
 # Animate the transformation
 lt_fname = '8-ladderparadox_transform.mp4'
 anim_lt = vis.animate_lt_worldline_and_realspace(scene, v,
     tlim=tlim, xlim=xlim, fps=fps, legend=True, title='Transforming frames...',
     current_time_color=current_time_color)
-anim_lt.save(lt_fname)
+anim_lt.save(lt_fname, **save_options)
 # Animate the rewind from the lab frame
 rew_fname = '8-ladderparadox_rewind.mp4'
 anim_rew = canim.Rewinder(anim_lab, rewind_rate=5)
-anim_rew.save(rew_fname)
+anim_rew.save(rew_fname, **save_options)
 
 # Glue the animations together
 canim.concat_demuxer([lab_fname, rew_fname, lt_fname, ladder_fname],
@@ -76,6 +76,10 @@ xlim = (geom.lorentz_transformed(return_event, v).x - pad,
 current_time_color = 'limegreen'
 instant_pause_time = 0.5
 fps = 100
+# Save every clip with the same encoding so they can be glued together without
+# re-encoding
+save_options = {'writer': 'ffmpeg', 'codec': 'h264',
+    'extra_args': ['-pix_fmt', 'yuv420p']}
 legend = True
 earth_fname = '9-twinparadox_earth.mp4'
 anim_earth = vis.stanimate_with_worldline(scene,
@@ -84,18 +88,18 @@ anim_earth = vis.stanimate_with_worldline(scene,
     title="Twin paradox (Earth's POV)",
     current_time_color=current_time_color,
     instant_pause_time=instant_pause_time)
-anim_earth.save(earth_fname)
+anim_earth.save(earth_fname, **save_options)
 # Rewind
 rew_fname = '9-twinparadox_rewind.mp4'
 anim_rew = canim.Rewinder(anim_earth, rewind_rate=5)
-anim_rew.save(rew_fname)
+anim_rew.save(rew_fname, **save_options)
 # Transformation
 lt_fname = '9-twinparadox_transform.mp4'
 anim_lt = vis.animate_lt_worldline_and_realspace(scene, v,
     tlim=tlim, xlim=xlim, legend=legend, fps=fps,
     title=f'Transforming frames...',
     current_time_color=current_time_color)
-anim_lt.save(lt_fname)
+anim_lt.save(lt_fname, **save_options)
 
 # From the traveler's point of view during the first half of the journey
 scene.lorentz_transform(v)
@@ -106,10 +110,10 @@ anim_forward = vis.stanimate_with_worldline(scene,
     title="Twin paradox (traveler's POV)",
     current_time_color=current_time_color,
     instant_pause_time=instant_pause_time)
-anim_forward.save(forward_fname)
+anim_forward.save(forward_fname, **save_options)
 # Change directions mid-travel. Set the origin to the twin's current point, so
 # that it doesn't change mid-acceleration.
-dv = geom.lorentz_transformed(rocket_backward_alltime, v).velocity()
+dv = geom.compose_velocities(rocket_backward_alltime.velocity(), -v)
 # Time value of the turnaround, within the time resolution of a frame
 tval = round(turnaround_event.t * fps) / fps
 accel_fname = '9-twinparadox_accel.mp4'
@@ -118,7 +122,7 @@ anim_accel = vis.animate_lt_worldline_and_realspace(scene, dv,
     title=f'Changing direction...\nTime = {tval:.3f}',
     current_time_color='limegreen', time=turnaround_event.t,
     display_current_velocity=False)
-anim_accel.save(accel_fname)
+anim_accel.save(accel_fname, **save_options)
 # From the traveler's point of view during the second half of the journey
 scene.lorentz_transform(dv, origin=turnaround_event)
 backward_fname = '9-twinparadox_backward.mp4'
@@ -128,7 +132,7 @@ anim_backward = vis.stanimate_with_worldline(scene,
     title="Twin paradox (traveler's POV)",
     current_time_color=current_time_color,
     instant_pause_time=instant_pause_time)
-anim_backward.save(backward_fname)
+anim_backward.save(backward_fname, **save_options)
 
 # Glue all the parts together
 canim.concat_demuxer([earth_fname, rew_fname, lt_fname,
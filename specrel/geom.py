@@ -11,9 +11,12 @@ Object drawing is done abstractly, with concrete graphics code delegated to
 
 from abc import ABC, abstractmethod
 import copy
+from functools import lru_cache
 from math import atan2
 import warnings
 
+import numpy as np
+
 geomrc = {
     'origin': (0, 0),
     'tlim': (None, None),
@@ -60,11 +63,14 @@ class LorentzTransformable(ABC):
             For a legend entry, instead use the Matplotlib draw option `label`
             in the `draw_options` property/parameter.
     """
+    # Leave it to subclasses whether to use slots or an instance dict
+    __slots__ = ()
 
     @abstractmethod
     def __init__(self, tag, draw_options):
         self.tag = tag
-        self.draw_options = dict(draw_options)
+        # Most objects have no draw options, which don't need a real copy
+        self.draw_options = dict(draw_options) if draw_options else {}
 
     @abstractmethod
     def lorentz_transform(self, velocity, origin):
@@ -117,11 +123,20 @@ class LorentzTransformable(ABC):
         in the format (tmin, tmax), (xmin, xmax)"""
         raise NotImplementedError
 
+    def _transform_leaves(self):
+        """Yield every STVector underlying the object, each paired with a flag
+        for whether it's a position (shifted by the transformation origin) or a
+        displacement (not shifted). By default, the object can't be broken
+        down, so it's yielded whole with a flag of None, and is transformed
+        with its own lorentz_transform()."""
+        yield self, None
+
     def _fill_auto_lims(self, tlim, xlim):
         """Fill in automatic limits only where explicit limits aren't given, and
         return in the format (tmin, tmax), (xmin, xmax)"""
-        tmin, tmax, xmin, xmax = tlim + xlim
-        if None in tlim + xlim:
+        tmin, tmax = tlim
+        xmin, xmax = xlim
+        if tmin is None or tmax is None or xmin is None or xmax is None:
             # Only compute automatic limits if needed
             (tminauto, tmaxauto), (xminauto, xmaxauto) = self._auto_draw_lims()
             if tmin is None:
@@ -134,6 +149,106 @@ class LorentzTransformable(ABC):
                 xmax = xmaxauto
         return (tmin, tmax), (xmin, xmax)
 
+class _LorentzBoost:
+    """Lorentz transformation with a single velocity, with the gamma factor
+    and boost matrix computed once up front. Get instances with
+    _lorentz_boost() rather than constructing them directly, so they're shared
+    between calls."""
+    __slots__ = ('velocity', 'gamma', 'matrix')
+
+    def __init__(self, velocity):
+        self.velocity = velocity
+        self.gamma = STVector.gamma_factor(velocity)
+        # Acts on (t, x) column vectors. The matrix is shared between calls, so
+        # guard it from modification.
+        self.matrix = np.array([
+            [self.gamma, -self.gamma*velocity],
+            [-self.gamma*velocity, self.gamma],
+        ])
+        self.matrix.flags.writeable = False
+
+    def apply(self, t, x, t0, x0):
+        """Scalar transformation of the point (t, x) about (t0, x0), returned
+        as a (t, x) tuple"""
+        dt = t - t0
+        dx = x - x0
+        return (self.gamma*(dt - self.velocity*dx) + t0,
+            self.gamma*(dx - self.velocity*dt) + x0)
+
+@lru_cache(maxsize=64)
+def _lorentz_boost(velocity):
+    """Shared _LorentzBoost for a velocity. Cached, since the same few
+    velocities tend to be reused many times."""
+    return _LorentzBoost(velocity)
+
+def _line_intersect_params(dt1, dx1, t1, x1, dt2, dx2, t2, x2):
+    """Numerator and denominator of the parameter k at which the line
+    (t1, x1) + k*(dt1, dx1) meets the line (t2, x2) + k'*(dt2, dx2)"""
+    numerator = x2*dt2 - t2*dx2 + dx2*t1 - dt2*x1
+    denominator = dx1*dt2 - dt1*dx2
+    return numerator, denominator
+
+def _transforms_by_leaves(transformable):
+    """Whether an object's Lorentz transformation is fully described by its
+    _transform_leaves(), i.e. whether it doesn't override lorentz_transform()
+    with custom logic"""
+    return type(transformable).lorentz_transform in (
+        STVector.lorentz_transform, Collection.lorentz_transform)
+
+def _lorentz_transform_leaves(leaves, velocity, origin):
+    """Lorentz transform a list of (STVector, is_position) pairs with batched
+    matrix multiplications, then write the results back. Objects paired with a
+    flag of None are transformed individually with their own
+    lorentz_transform()."""
+    for tr, is_position in leaves:
+        if is_position is None:
+            tr.lorentz_transform(velocity, origin)
+    leaves = [leaf for leaf in leaves if leaf[1] is not None]
+    if not leaves:
+        return
+    boost = _lorentz_boost(velocity).matrix
+    # Gather positions and displacements into separate contiguous (N, 2)
+    # buffers, since only positions are shifted by the origin
+    positions = [p for p, is_position in leaves if is_position]
+    displacements = [p for p, is_position in leaves if not is_position]
+    if positions:
+        origin = np.array(tuple(origin), dtype=float)
+        coords = np.array([(p.t, p.x) for p in positions], dtype=float)
+        _write_coords(positions, (coords - origin) @ boost.T + origin)
+    if displacements:
+        coords = np.array([(p.t, p.x) for p in displacements], dtype=float)
+        _write_coords(displacements, coords @ boost.T)
+
+def _gamma_factor(velocity):
+    """Uncached gamma factor calculation"""
+    return 1/(1 - velocity**2)**0.5
+
+# The same few velocities tend to be reused many times, e.g. by every frame of
+# an animation
+_cached_gamma_factor = lru_cache(maxsize=256)(_gamma_factor)
+
+def _tolerance(precision):
+    """Absolute tolerance for comparisons to some number of decimal places"""
+    return 0.5 * 10.0**-precision
+
+def _coords_and_tolerances(stvectors):
+    """Arrays of the time values, position values and comparison tolerances of
+    a list of STVectors"""
+    return np.array([(p.t, p.x, _tolerance(p.precision)) for p in stvectors],
+        dtype=float).reshape(-1, 3).T
+
+def _in_bounds_mask(t, x, tol, tlim, xlim):
+    """Vectorized STVector._in_bounds over arrays of time values, position
+    values and tolerances"""
+    return ((tlim[0] - tol <= t) & (t <= tlim[1] + tol)
+        & (xlim[0] - tol <= x) & (x <= xlim[1] + tol))
+
+def _write_coords(stvectors, coords):
+    """Write rows of an (N, 2) coordinate array back into STVectors"""
+    for p, (t, x) in zip(stvectors, coords.tolist()):
+        p.t = t
+        p.x = x
+
 """Return a Lorentz transformed copy of a LorentzTransformable"""
 def lorentz_transformed(transformable, velocity, origin=geomrc['origin']):
     """Lorentz transforms an object and returns a copy.
@@ -162,6 +277,60 @@ def lorentz_boosted(transformable, velocity, origin=geomrc['origin']):
     boosted.lorentz_boost(velocity, origin)
     return boosted
 
+def intersect_many(lines1, lines2):
+    """Calculates intersections between many pairs of lines at once. The
+    intersection parameters for all the pairs are solved for together, which
+    is faster than calling `specrel.geom.Line.intersect` on each pair.
+
+    Args:
+        lines1 (list): List of `specrel.geom.Line` objects.
+        lines2 (list): List of `specrel.geom.Line` objects to intersect with
+            the corresponding lines in `lines1`.
+
+    Returns:
+        list:
+            The intersection of each pair of lines, the same as
+            `lines1[i].intersect(lines2[i])`.
+
+    Raises:
+        ValueError:
+            If the two lists of lines have different lengths.
+    """
+    if len(lines1) != len(lines2):
+        raise ValueError('Must have the same number of lines in each list.')
+    if not lines1:
+        return []
+    def line_params(lines):
+        """Columns of direction t, direction x, point t and point x"""
+        return np.array([(ln.direction().t, ln.direction().x, ln.point().t,
+            ln.point().x) for ln in lines], dtype=float).T
+    numerators, denominators = _line_intersect_params(
+        *line_params(lines1), *line_params(lines2))
+    return [line1._intersect_from_lineparam(line2, numerator, denominator)
+        for line1, line2, numerator, denominator in zip(
+            lines1, lines2, numerators.tolist(), denominators.tolist())]
+
+def compose_velocities(*velocities):
+    """Composes successive Lorentz transformation velocities into a single one,
+    using the relativistic velocity addition formula. Transforming about the
+    same origin with each velocity in turn is equivalent to a single transform
+    with the composed velocity, but only takes one pass over the object.
+
+    This is also the velocity of an object with velocity `velocities[0]` as
+    seen from a frame moving at `-velocities[1]`, etc.
+
+    Args:
+        *velocities (float): Velocities of the successive transformations.
+
+    Returns:
+        float:
+            Velocity of the equivalent single transformation.
+    """
+    composed = 0
+    for velocity in velocities:
+        composed = (composed + velocity) / (1 + composed*velocity)
+    return composed
+
 class STVector(LorentzTransformable):
     """A vector in spacetime (t, x). `*args` can be one of two options
     (see below). `**kwargs` are for attributes other than `t` and `x`, and
@@ -182,12 +351,15 @@ class STVector(LorentzTransformable):
     Attributes:
         draw_options (dict): See `specrel.geom.LorentzTransformable`.
         precision (int): Floating-point precision for comparisons. Two
-            `STVector` are equal if the components agree to this many decimal
-            places.
+            `STVector` are equal if their components differ by at most half a
+            unit in this decimal place (e.g. by at most 0.05 for a precision
+            of 1). Bounds checks use the same tolerance.
         t (float): Time value of the vector.
         tag (str): See `specrel.geom.LorentzTransformable`.
         x (float): Position value of the vector.
     """
+    # STVectors are by far the most numerous objects, so skip the instance dict
+    __slots__ = ('t', 'x', 'tag', 'precision', 'draw_options')
 
     def __init__(self, *args, **kwargs):
         # args can either be:
@@ -202,25 +374,15 @@ class STVector(LorentzTransformable):
             # An iterable representing (t, x) was provided
             # This can function as a copy ctor if said iterable was an STVector
             self._constructor(*args[0], **kwargs)
-            # If no tag is given explicitly, copy over the old tag if it exists
-            # i.e. if the object is an STVector, not just a tuple or something
-            if 'tag' not in kwargs:
-                try:
+            # If the object is an STVector, not just a tuple or something,
+            # copy over any old attributes that aren't given explicitly
+            if isinstance(args[0], STVector):
+                if 'tag' not in kwargs:
                     self.tag = args[0].tag
-                except:
-                    pass
-            # If no precision given, copy over the old precision if it exists
-            if 'precision' not in kwargs:
-                try:
+                if 'precision' not in kwargs:
                     self.precision = args[0].precision
-                except:
-                    pass
-            # If no draw options given, copy over the old ones if they exist
-            if 'draw_options' not in kwargs:
-                try:
+                if 'draw_options' not in kwargs:
                     self.draw_options = dict(args[0].draw_options)
-                except:
-                    pass
         else:
             raise TypeError('Too many positional arguments.')
 
@@ -232,9 +394,28 @@ class STVector(LorentzTransformable):
         self.x = position
         self.precision = precision
 
+    @classmethod
+    def _from_components(cls, time, position, precision=geomrc['precision']):
+        """Fast constructor for internal use, with no tag or draw options.
+        Equivalent to STVector(time, position, precision=precision), but
+        skips the argument handling in __init__."""
+        stvec = cls.__new__(cls)
+        stvec.t = time
+        stvec.x = position
+        stvec.tag = None
+        stvec.precision = precision
+        stvec.draw_options = {}
+        return stvec
+
     def __getitem__(self, key):
         """The order is (t, x), consistent with standard notation for 4-position
         in physics"""
+        # Plain indices are by far the most common, so avoid building a list
+        if key == 0:
+            return self.t
+        if key == 1:
+            return self.x
+        # Negative indices, slices, and out-of-range errors
         return [self.t, self.x][key]
 
     def __str__(self):
@@ -248,42 +429,83 @@ class STVector(LorentzTransformable):
         yield self.x
 
     def __eq__(self, other):
-        """Equality within internal precision settings"""
-        # Compare up to the precision of the two objects
-        try:
+        """Equality within internal precision settings. Components are equal
+        if they differ by at most half a unit in the last decimal place."""
+        # Compare up to the precision of the two objects. A plain tuple has
+        # no precision field, so use this object's precision alone
+        if isinstance(other, STVector):
             precision = min(self.precision, other.precision)
-        except AttributeError:  # other has no precision field
+            other_t, other_x = other.t, other.x
+        else:
             precision = self.precision
+            try:
+                other_t, other_x = other
+            except (TypeError, ValueError):
+                # Not a (t, x) pair
+                return NotImplemented
 
-        for selfcmp, othercmp in zip(self, other):
-            if round(selfcmp, precision) != round(othercmp, precision):
-                return False
-        return True
+        tol = _tolerance(precision)
+        return abs(self.t - other_t) <= tol and abs(self.x - other_x) <= tol
 
     def __ne__(self, other):
         return not (self == other)
 
+    # Arithmetic results are built from their components directly, rather than
+    # through the iterable copy constructor, which would probe the operands for
+    # attributes to copy
+
     def __neg__(self):
-        return STVector((-cmp for cmp in self))
+        return STVector._from_components(-self.t, -self.x)
 
     def __add__(self, other):
         """Vector-vector addition"""
-        return STVector((left + right for left, right in zip(self, other)))
+        other_t, other_x = other
+        return STVector._from_components(self.t + other_t, self.x + other_x)
 
     def __sub__(self, other):
         """Vector-vector subtraction"""
-        return self + -other
+        other_t, other_x = other
+        return STVector._from_components(self.t - other_t, self.x - other_x)
 
     def __abs__(self):
         """Spacetime interval"""
         return -self.t**2 + self.x**2
 
+    def __copy__(self):
+        """Faster than the generic shallow copy, which goes through the
+        pickling protocol for slotted classes"""
+        copied = type(self).__new__(type(self))
+        copied.t = self.t
+        copied.x = self.x
+        copied.tag = self.tag
+        copied.precision = self.precision
+        copied.draw_options = self.draw_options
+        # Subclasses might have an instance dict with extra attributes
+        if hasattr(self, '__dict__'):
+            copied.__dict__.update(self.__dict__)
+        return copied
+
+    def __deepcopy__(self, memo):
+        """Faster than the generic deep copy. The components, tag and precision
+        are immutable, so only the draw options need to be copied."""
+        copied = type(self).__new__(type(self))
+        memo[id(self)] = copied
+        copied.t = self.t
+        copied.x = self.x
+        copied.tag = self.tag
+        copied.precision = self.precision
+        # Subclasses might have an instance dict with extra attributes
+        if hasattr(self, '__dict__'):
+            copied.__dict__.update(copy.deepcopy(self.__dict__, memo))
+        if self.draw_options:
+            copied.draw_options = copy.deepcopy(self.draw_options, memo)
+        else:
+            copied.draw_options = {}
+        return copied
+
     def lorentz_transform(self, velocity, origin=geomrc['origin']):
-        gamma = self.gamma_factor(velocity)
-        t, x = self
         t0, x0 = origin
-        self.t = gamma*((t - t0) - velocity*(x - x0)) + t0
-        self.x = gamma*((x - x0) - velocity*(t - t0)) + x0
+        self.t, self.x = _lorentz_boost(velocity).apply(self.t, self.x, t0, x0)
 
     def draw(self, plotter, tlim=geomrc['tlim'], xlim=geomrc['xlim'], **kwargs):
         # Only draw if in bounds
@@ -296,25 +518,32 @@ class STVector(LorentzTransformable):
     def _auto_draw_lims(self):
         return (self.t, self.t), (self.x, self.x)
 
+    def _transform_leaves(self):
+        yield self, True
+
     def _in_bounds(self, tlim, xlim):
         """Check if the point is in a given set of bounds"""
-        return (round(self.t, self.precision) >= round(tlim[0], self.precision) \
-            and round(self.t, self.precision) <= round(tlim[1], self.precision) \
-            and round(self.x, self.precision) >= round(xlim[0], self.precision) \
-            and round(self.x, self.precision) <= round(xlim[1], self.precision))
+        tol = _tolerance(self.precision)
+        return (tlim[0] - tol <= self.t <= tlim[1] + tol
+            and xlim[0] - tol <= self.x <= xlim[1] + tol)
 
     @staticmethod
     def gamma_factor(velocity):
         """Calculates the relativistic gamma factor for a given velocity.
 
         Args:
-            velocity (float): Relative velocity.
+            velocity (float or numpy.ndarray): Relative velocity, or an array
+                of velocities.
 
         Returns:
-            float:
+            float or numpy.ndarray:
                 Gamma factor for `velocity`.
         """
-        return 1/(1 - velocity**2)**0.5
+        try:
+            return _cached_gamma_factor(velocity)
+        except TypeError:
+            # Unhashable, e.g. an array of velocities, so can't be cached
+            return _gamma_factor(velocity)
 
 class Collection(LorentzTransformable):
     """Collection of `specrel.geom.LorentzTransformable` objects. Holds
@@ -333,9 +562,7 @@ class Collection(LorentzTransformable):
     def __init__(self, transformables=(), tag=geomrc['tag'],
         draw_options=geomrc['draw_options']):
         super().__init__(tag=tag, draw_options=draw_options)
-        self.transformables = []
-        for tr in transformables:
-            self.transformables.append(tr)
+        self.transformables = list(transformables)
 
     def __getitem__(self, key):
         return self.transformables[key]
@@ -346,6 +573,22 @@ class Collection(LorentzTransformable):
     def __len__(self):
         return len(self.transformables)
 
+    def __deepcopy__(self, memo):
+        """Deep copy every attribute directly, skipping the generic pickling
+        protocol. Passing memo along keeps shared references shared in the
+        copy. Children are copied straight into a new list, and unset
+        attributes are not dispatched at all."""
+        copied = type(self).__new__(type(self))
+        memo[id(self)] = copied
+        for attr, value in self.__dict__.items():
+            if attr == 'transformables':
+                # Copy the children directly rather than through the list
+                value = [copy.deepcopy(tr, memo) for tr in value]
+            elif value is not None:
+                value = copy.deepcopy(value, memo)
+            setattr(copied, attr, value)
+        return copied
+
     def append(self, transformable):
         """Append an element to the `Collection`.
 
@@ -374,8 +617,17 @@ class Collection(LorentzTransformable):
         return self.transformables.pop(pos)
 
     def lorentz_transform(self, velocity, origin=geomrc['origin']):
+        # Gather every underlying STVector and transform them all at once
+        _lorentz_transform_leaves(list(self._transform_leaves()), velocity,
+            origin)
+
+    def _transform_leaves(self):
         for tr in self:
-            tr.lorentz_transform(velocity, origin)
+            if _transforms_by_leaves(tr):
+                yield from tr._transform_leaves()
+            else:
+                # Defer to the object's own transformation logic
+                yield tr, None
 
     def draw(self, plotter, tlim=geomrc['tlim'], xlim=geomrc['xlim'], **kwargs):
         # Cannot draw an empty collection, so just do nothing
@@ -385,21 +637,46 @@ class Collection(LorentzTransformable):
         kwargs = {**self.draw_options, **kwargs}
         # Fill in automatic limits
         tlim, xlim = self._fill_auto_lims(tlim, xlim)
-        # Plot each transformable with the same limits
+        # Plot each transformable with the same limits. Runs of consecutive
+        # untagged lines with the same draw options (e.g. grid lines) are
+        # batched into a single draw call. Only do this if the options fix a
+        # color, since drawing the lines separately would otherwise give each
+        # one its own color from the plotter's color cycle.
+        segments = []
+        segment_kwargs = None
         for tr in self:
+            tr_kwargs = {**tr.draw_options, **kwargs}
+            if (type(tr).draw is Line.draw and not tr.tag
+                and 'color' in tr_kwargs):
+                endpoints = tr._clipped_endpoints(tlim, xlim)
+                if len(endpoints) == 2:
+                    if segments and tr_kwargs != segment_kwargs:
+                        plotter.draw_line_segments(segments, **segment_kwargs)
+                        segments = []
+                    segments.append(tuple(endpoints))
+                    segment_kwargs = tr_kwargs
+                    continue
+            if segments:
+                plotter.draw_line_segments(segments, **segment_kwargs)
+                segments = []
             tr.draw(plotter, tlim, xlim, **kwargs)
+        if segments:
+            plotter.draw_line_segments(segments, **segment_kwargs)
         # Make sure plot limits are properly set
         plotter.set_lims(tlim, xlim)
 
     def _auto_draw_lims(self):
-        tmin, tmax, xmin, xmax = None, None, None, None
-        for tr in self:
-            (new_tmin, new_tmax), (new_xmin, new_xmax) = tr._auto_draw_lims()
-            tmin = new_tmin if tmin is None else min(tmin, new_tmin)
-            tmax = new_tmax if tmax is None else max(tmax, new_tmax)
-            xmin = new_xmin if xmin is None else min(xmin, new_xmin)
-            xmax = new_xmax if xmax is None else max(xmax, new_xmax)
-        return (tmin, tmax), (xmin, xmax)
+        # Reduce each limit over all the elements at once, rather than
+        # updating running values one element at a time. Skip elements
+        # without limits (e.g. empty nested collections).
+        lims = [(tmin, tmax, xmin, xmax)
+            for (tmin, tmax), (xmin, xmax)
+            in (tr._auto_draw_lims() for tr in self)
+            if None not in (tmin, tmax, xmin, xmax)]
+        if not lims:
+            return (None, None), (None, None)
+        tmins, tmaxs, xmins, xmaxs = zip(*lims)
+        return (min(tmins), max(tmaxs)), (min(xmins), max(xmaxs))
 
 class PointGroup(Collection):
     """Collection of specifically `specrel.geom.STVector` references.
@@ -436,9 +713,19 @@ class PointGroup(Collection):
             PointGroup.POLYGON: self._draw_polygon
         }
         self.mode = mode
-        super().__init__([STVector(p) for p in points],
+        super().__init__([self._to_stvector(p) for p in points],
             tag=tag, draw_options=draw_options)
 
+    @staticmethod
+    def _to_stvector(point):
+        """Copy an STVector along with its attributes, or build a plain
+        STVector from a bare (t, x) pair without going through
+        STVector.__init__"""
+        if isinstance(point, STVector):
+            return STVector(point)
+        t, x = point
+        return STVector._from_components(t, x)
+
     def draw(self, plotter, tlim=geomrc['tlim'], xlim=geomrc['xlim'], **kwargs):
         kwargs = {**self.draw_options, **kwargs}
         # Fill in automatic limits
@@ -448,13 +735,58 @@ class PointGroup(Collection):
         # Make sure plot limits are properly set
         plotter.set_lims(tlim, xlim)
 
+    def _auto_draw_lims(self):
+        if len(self) == 0:
+            return (None, None), (None, None)
+        # Every element is an STVector, so reduce over the coordinates
+        # directly instead of going through each element's limits
+        ts = [p.t for p in self.transformables]
+        xs = [p.x for p in self.transformables]
+        return (min(ts), max(ts)), (min(xs), max(xs))
+
     def _draw_point(self, plotter, tlim, xlim, **kwargs):
         """Drawing for unconnected points"""
-        super().draw(plotter, tlim, xlim, **kwargs)
+        if len(self) == 0:
+            # Let the base class handle the nothing-to-draw warning
+            super().draw(plotter, tlim, xlim, **kwargs)
+            return
+        # Same as drawing each point individually, but with the bounds checks
+        # done for all the points at once
+        t, x, tol = _coords_and_tolerances(self)
+        in_bounds = _in_bounds_mask(t, x, tol, tlim, xlim)
+        # Runs of consecutive untagged points with the same draw options are
+        # batched into a single draw call. Only do this if the options fix a
+        # color, since drawing the points separately would otherwise give each
+        # one its own color from the plotter's color cycle.
+        points = []
+        points_kwargs = None
+        for p, visible in zip(self, in_bounds.tolist()):
+            if not visible:
+                continue
+            p_kwargs = {**p.draw_options, **kwargs}
+            if not p.tag and 'color' in p_kwargs:
+                if points and p_kwargs != points_kwargs:
+                    plotter.draw_points(points, **points_kwargs)
+                    points = []
+                points.append(p)
+                points_kwargs = p_kwargs
+                continue
+            if points:
+                plotter.draw_points(points, **points_kwargs)
+                points = []
+            plotter.draw_point(p, tag=p.tag, **p_kwargs)
+        if points:
+            plotter.draw_points(points, **points_kwargs)
 
     def _draw_connect(self, plotter, tlim, xlim, **kwargs):
         """Drawing for connected line segments"""
-        # Use the overall collection's tag on each line segment
+        # Use the overall collection's tag on each line segment. Only draw
+        # the segments all at once if the options fix a color, since drawing
+        # them separately would otherwise give each one its own color from the
+        # plotter's color cycle.
+        if 'color' in kwargs:
+            plotter.draw_polyline(self.transformables, tag=self.tag, **kwargs)
+            return
         for p1, p2 in zip(self[:-1], self[1:]):
             plotter.draw_line_segment(p1, p2, tag=self.tag, **kwargs)
 
@@ -534,9 +866,11 @@ class Line(Collection):
             + f'{round(self.direction()[1], precision)}] )'
 
     def __eq__(self, other):
-        # Equality is just one of the outcomes in the intersection method
-        # The returned value will be a Line iff the lines are equal
-        return isinstance(self.intersect(other), Line)
+        # Equality is just one of the outcomes in the intersection method:
+        # the lines are equal iff the intersection is a whole line. Check for
+        # that case directly, since intersect() would return a deep copy.
+        return self._coincident(*self._intersect_lineparam(other),
+            min(self.precision(), other.precision()))
 
     def __ne__(self, other):
         return not (self == other)
@@ -545,11 +879,11 @@ class Line(Collection):
         """Disabled; will raise a `TypeError`."""
         raise TypeError("Cannot append to object of type 'Line'")
 
-    def lorentz_transform(self, velocity, origin=geomrc['origin']):
+    def _transform_leaves(self):
         # If the origin is shifted, apply the shifted transform only to the
         # point, and not the direction
-        self.point().lorentz_transform(velocity, origin)
-        self.direction().lorentz_transform(velocity)
+        yield self.direction(), False
+        yield self.point(), True
 
     def direction(self):
         """
@@ -575,7 +909,7 @@ class Line(Collection):
                 Floating-point precision of internal `specrel.geom.STVector`
                 objects.
         """
-        return min([p.precision for p in self])
+        return min(self.direction().precision, self.point().precision)
 
     def slope(self):
         """
@@ -585,9 +919,10 @@ class Line(Collection):
             NoneType:
                 `None` if vertical.
         """
-        if self.direction().x == 0:
+        direc = self.direction()
+        if direc.x == 0:
             return None
-        return self.direction().t / self.direction().x
+        return direc.t / direc.x
 
     def intersect(self, other):
         """Calculates intersection between two lines.
@@ -603,21 +938,16 @@ class Line(Collection):
             NoneType:
                 `None` if the lines don't intersect.
         """
+        return self._intersect_from_lineparam(other,
+            *self._intersect_lineparam(other))
+
+    def _intersect_from_lineparam(self, other, lineparam_numerator,
+        lineparam_denominator):
+        """Finish an intersection calculation, given the numerator and
+        denominator of the intersection line parameter"""
         # Compare up to the precision of the two lines
         precision = min(self.precision(), other.precision())
 
-        # Solution for the parameterization variable at the intersection point
-        # from doing algebra
-        # self is the line: self.point() + lineparam * self.direction()
-        lineparam_numerator = (
-            other.point().x * other.direction().t
-            - other.point().t * other.direction().x
-            + other.direction().x * self.point().t
-            - other.direction().t * self.point().x)
-        lineparam_denominator = (
-            self.direction().x * other.direction().t
-            - self.direction().t * other.direction().x)
-
         # Zero denominator means the lines have equal slope
         if round(lineparam_denominator, precision) == 0:
             # 0/0 means the lines are equal
@@ -627,47 +957,87 @@ class Line(Collection):
             else:
                 return None
 
-        # Lines intersect at a point
+        # Lines intersect at a point, if the point is actually on the object
         lineparam = lineparam_numerator / lineparam_denominator
-        return STVector(
-            self.point().t + lineparam * self.direction().t,
-            self.point().x + lineparam * self.direction().x,
+        if not self._has_lineparam(lineparam, precision):
+            return None
+        return self._point_at(lineparam, precision)
+
+    @staticmethod
+    def _coincident(lineparam_numerator, lineparam_denominator, precision):
+        """Whether the intersection line parameter is 0/0, meaning the lines
+        are equal"""
+        return (round(lineparam_denominator, precision) == 0
+            and round(lineparam_numerator, precision) == 0)
+
+    def _has_lineparam(self, lineparam, precision):
+        """Whether a value of the parameterization variable is within the
+        object. Always true for a full line."""
+        return True
+
+    def _intersect_lineparam(self, other):
+        """Numerator and denominator of the parameterization variable k at the
+        intersection with another line, where self is the line
+        self.point() + k*self.direction()"""
+        direc, point = self.direction(), self.point()
+        other_direc, other_point = other.direction(), other.point()
+        return _line_intersect_params(
+            direc.t, direc.x, point.t, point.x,
+            other_direc.t, other_direc.x, other_point.t, other_point.x)
+
+    def _point_at(self, lineparam, precision):
+        """Point on the line at a given value of the parameterization
+        variable."""
+        direc, point = self.direction(), self.point()
+        return STVector._from_components(
+            point.t + lineparam * direc.t,
+            point.x + lineparam * direc.x,
             precision=precision)
 
     def _boundary_intersections(self, tlim, xlim):
         """Returns a list of point intersections of a line with the time and
         space boundaries, sorted in ascending order by time, then space"""
-        # The four sides of the bounding box
-        boundaries = [
-            fixedtime(tlim[0]), fixedtime(tlim[1]),
-            fixedspace(xlim[0]), fixedspace(xlim[1])
-        ]
         boundary_points = []    # Intersected points on the bounding box
-        for bound in boundaries:
-            # If the line is parallel to one set of bounds, it will cross the
-            # perpendicular bounds; just skip
-            crossing = self.intersect(bound)
-            if isinstance(crossing, Line) or crossing is None:
-                continue
+        for crossing in self._boundary_crossings(tlim, xlim):
             # Add it to the boundary point list if it's not already there
             if crossing not in boundary_points:
                 boundary_points.append(crossing)
         return sorted(boundary_points, key=lambda p:(p.t, p.x))
 
+    def _boundary_crossings(self, tlim, xlim):
+        """Yields the points where the object crosses the lines along the sides
+        of the bounding box, unsorted and possibly with duplicates. Unlike
+        _boundary_intersections, this is lazy, for callers that do their own
+        deduplication and filtering."""
+        for t, x, precision in self._boundary_crossing_coords(tlim, xlim):
+            yield STVector._from_components(t, x, precision)
+
+    def _boundary_crossing_coords(self, tlim, xlim):
+        """Same as _boundary_crossings, but yields bare (t, x, precision)
+        tuples rather than STVectors"""
+        # Same as intersecting with fixedtime() and fixedspace() lines along
+        # the four sides of the bounding box, but since those are axis-aligned,
+        # the line parameter of each crossing has a simple closed form
+        precision = min(self.precision(), geomrc['precision'])
+        direc, point = self.direction(), self.point()
+        lineparams = [(time - point.t, direc.t) for time in tlim] \
+            + [(position - point.x, direc.x) for position in xlim]
+        for numerator, denominator in lineparams:
+            # If the line is parallel to one set of bounds, it will cross the
+            # perpendicular bounds; just skip
+            if round(denominator, precision) == 0:
+                continue
+            lineparam = numerator / denominator
+            if self._has_lineparam(lineparam, precision):
+                # Same as _point_at()
+                yield (point.t + lineparam * direc.t,
+                    point.x + lineparam * direc.x, precision)
+
     def draw(self, plotter, tlim=geomrc['tlim'], xlim=geomrc['xlim'], **kwargs):
         kwargs = {**self.draw_options, **kwargs}
         # Fill in automatic limits
         tlim, xlim = self._fill_auto_lims(tlim, xlim)
-
-        # Clip to the bounding box, and add keep points if they're in-bounds
-        boundary_points = [p for p in self._boundary_intersections(tlim, xlim)
-            if p._in_bounds(tlim, xlim)]
-        # This shouldn't happen, but issue a warning and fall back to the first
-        # and last points if it does
-        if len(boundary_points) > 2:
-            warnings.warn('Clipped line has more than two endpoints. '
-                'Floating point error with a corner clip?')
-            boundary_points = [boundary_points[0], boundary_points[-1]]
+        boundary_points = self._clipped_endpoints(tlim, xlim)
 
         # Plot the clipped line segment
         if len(boundary_points) == 2:
@@ -683,16 +1053,26 @@ class Line(Collection):
         # Make sure plot limits are properly set
         plotter.set_lims(tlim, xlim)
 
+    def _clipped_endpoints(self, tlim, xlim):
+        """Returns a list of at most two endpoints of the line, clipped to the
+        given bounding box"""
+        # Clip to the bounding box, and add keep points if they're in-bounds
+        boundary_points = [p for p in self._boundary_intersections(tlim, xlim)
+            if p._in_bounds(tlim, xlim)]
+        # This shouldn't happen, but issue a warning and fall back to the first
+        # and last points if it does
+        if len(boundary_points) > 2:
+            warnings.warn('Clipped line has more than two endpoints. '
+                'Floating point error with a corner clip?')
+            boundary_points = [boundary_points[0], boundary_points[-1]]
+        return boundary_points
+
     def _auto_draw_lims(self):
         # Go one step of the direction vector forward and backward from the
         # anchor point
-        forward = self.point() + self.direction()
-        backward = self.point() - self.direction()
-        tmin = min(forward.t, backward.t)
-        tmax = max(forward.t, backward.t)
-        xmin = min(forward.x, backward.x)
-        xmax = max(forward.x, backward.x)
-        return (tmin, tmax), (xmin, xmax)
+        point, direc = self.point(), self.direction()
+        dt, dx = abs(direc.t), abs(direc.x)
+        return (point.t - dt, point.t + dt), (point.x - dx, point.x + dx)
 
 def fixedspace(position, tag=geomrc['tag'],
     draw_options=geomrc['draw_options']):
@@ -760,48 +1140,39 @@ class Ray(Line):
             float:
                 Dot product between the anchor-point and direction vectors.
         """
-        return sum([(x - p)*d for x, p, d in zip(
-            point, self.point(), self.direction())])
+        point_t, point_x = point
+        anchor, direc = self.point(), self.direction()
+        return (point_t - anchor.t)*direc.t + (point_x - anchor.x)*direc.x
 
     def intersect(self, line):
         """Intersection point between a ray and a line. Similar to
         `specrel.geom.Line.intersect`, but returns never returns a
         `specrel.geom.Line`, and returns a `Ray` if the ray and line coincide.
         """
-        # Pretend this is a full line to start
-        ll_intersect = super().intersect(line)
-        if ll_intersect is None:
-            # If no intersection, one object being a Ray won't change anything
-            return ll_intersect
-        if isinstance(ll_intersect, Line):
-            return copy.deepcopy(self)  # Replace the full line with the Ray
-
-        precision = min(self.precision(), line.precision())
-        if round(self.point_dotprod(ll_intersect), precision) < 0:
-            # The intersection is opposite to the Ray's direction; i.e. no
-            # actual intersection
-            return None
-        return ll_intersect
+        return self._intersect_from_lineparam(line,
+            *self._intersect_lineparam(line))
+
+    def _has_lineparam(self, lineparam, precision):
+        # The dot product between the anchor-intersection vector and the
+        # direction is just the line parameter times the direction's squared
+        # norm, so there's no need to build the intersection point to check it.
+        # If it's negative, the intersection is opposite to the Ray's
+        # direction; i.e. no actual intersection
+        direc = self.direction()
+        return round(lineparam * (direc.t**2 + direc.x**2), precision) >= 0
 
     def _auto_draw_lims(self):
         # Go one step of the direction vector forward from the anchor point
-        forward = self.point() + self.direction()
-        tmin = min(forward.t, self.point().t)
-        tmax = max(forward.t, self.point().t)
-        xmin = min(forward.x, self.point().x)
-        xmax = max(forward.x, self.point().x)
-        return (tmin, tmax), (xmin, xmax)
+        point, direc = self.point(), self.direction()
+        forward_t, forward_x = point.t + direc.t, point.x + direc.x
+        return ((min(forward_t, point.t), max(forward_t, point.t)),
+            (min(forward_x, point.x), max(forward_x, point.x)))
 
-    def _boundary_intersections(self, tlim, xlim):
-        """Returns a list of point intersections of a ray with the time and
-        space boundaries, sorted in ascending order by time, then space,
-        including the ray endpoint"""
-        boundary_points = super()._boundary_intersections(tlim, xlim)
-        # Add the ray endpoint
-        if self.point() not in boundary_points:
-            boundary_points.append(self.point())
-        # Re-sort, since a new point was added
-        return sorted(boundary_points, key=lambda p:(p.t, p.x))
+    def _boundary_crossing_coords(self, tlim, xlim):
+        # Include the ray endpoint, so _boundary_intersections does too
+        yield from super()._boundary_crossing_coords(tlim, xlim)
+        point = self.point()
+        yield point.t, point.x, point.precision
 
 class Ribbon(Collection):
     """The region between two parallel spacetime lines.
@@ -825,6 +1196,10 @@ class Ribbon(Collection):
             raise ValueError('Lines must be parallel')
         super().__init__([copy.deepcopy(line1), copy.deepcopy(line2)],
             tag=tag, draw_options=draw_options)
+        # Cached result of _line_constants(), and the line coordinates it was
+        # computed from
+        self._line_constants_cache = None
+        self._line_constants_key = None
 
     def append(self, other):
         """Disabled; will raise a `TypeError`."""
@@ -833,28 +1208,47 @@ class Ribbon(Collection):
     def _point_inside(self, point):
         """Test whether a point lies inside the two line boundaries"""
         # Compare up to the precision of the two lines and the point
-        precision = min(self[0].precision(), self[1].precision())
-        try:    # If point is an STVector
+        precision = self._precision()
+        if isinstance(point, STVector):
             precision = min(precision, point.precision)
-        except:
-            pass
+        t, x = point
+        return bool(self._inside_mask(t, x, _tolerance(precision)))
+
+    def _precision(self):
+        """Floating-point precision of the boundary lines"""
+        return min(self[0].precision(), self[1].precision())
 
+    def _inside_mask(self, t, x, tol):
+        """Test whether points lie inside the region, up to some tolerance.
+        Works on either individual (t, x) coordinates or arrays of them, so
+        only uses operations that broadcast."""
+        # The constant "k" of the point (t, x) must be between those of the two
+        # line boundaries. These are computed once per call, so test many
+        # points with a single call where possible.
+        dt, dx, kmin, kmax = self._line_constants()
+        k = dx*t - dt*x
+        return (kmin - tol <= k) & (k <= kmax + tol)
+
+    def _line_constants(self):
+        """Returns the ribbon direction (dt, dx), along with the smaller and
+        larger constants k of the two line boundaries. The line parallel to the
+        ribbon through some point (t, x) has the constant k = dx*t - dt*x."""
         # The lines will be parallel, so just take the direction vector from
         # the first line
         direction = self[0].direction()
-        # Lines follow the equation dx*t - dt*x = k
-        # The constant "k" of the point (t, x) must be between those of the two
-        # line boundaries
-        def calc_line_constant(p):
-            return round(direction.x * p[0] - direction.t * p[1], precision)
-        boundary_constants = sorted(
-            [calc_line_constant(line.point()) for line in self]
-        )
-        point_constant = calc_line_constant(point)
-        return (round(point_constant, precision)
-            >= round(boundary_constants[0], precision)
-            and round(point_constant, precision)
-            <= round(boundary_constants[1], precision))
+        dt, dx = direction.t, direction.x
+        point1, point2 = self[0].point(), self[1].point()
+        # These are needed several times per draw, so only recompute them if
+        # the lines have moved since last time
+        key = (dt, dx, point1.t, point1.x, point2.t, point2.x)
+        if key != self._line_constants_key:
+            # Lines follow the equation dx*t - dt*x = k. Only cache plain
+            # numbers, so the object can still be pickled.
+            kmin, kmax = sorted([dx*point1.t - dt*point1.x,
+                dx*point2.t - dt*point2.x])
+            self._line_constants_cache = (dt, dx, kmin, kmax)
+            self._line_constants_key = key
+        return self._line_constants_cache
 
     def _boundaries(self):
         """Get a list of hard boundaries (i.e. the line boundaries)"""
@@ -863,34 +1257,65 @@ class Ribbon(Collection):
     def _get_vertices(self, tlim, xlim):
         """Get the polygon vertices for drawing the ribbon in a given view
         range"""
-        vertices = []
+        # Work with bare (t, x, precision) coordinates throughout, and only
+        # build STVectors for the final vertices
+        # Corners of the bounds, in counterclockwise order
+        corners = [(tcorner, xcorner, geomrc['precision'])
+            for tcorner, xcorner in [
+                (tlim[0], xlim[0]), (tlim[0], xlim[1]),
+                (tlim[1], xlim[1]), (tlim[1], xlim[0]),
+            ]
+        ]
+        # Skip the full calculation if the bounds are entirely inside or
+        # entirely outside of the region
+        t, x, precision = np.array(corners, dtype=float).T
+        tol = np.maximum(_tolerance(precision), _tolerance(self._precision()))
+        if self._inside_mask(t, x, tol).all():
+            if tlim[0] < tlim[1] and xlim[0] < xlim[1]:
+                return [STVector._from_components(*corner)
+                    for corner in corners]
+        else:
+            # The region never leaves the strip between the line boundaries,
+            # so if all corners are past the same line, nothing is in bounds
+            dt, dx, kmin, kmax = self._line_constants()
+            k = dx*t - dt*x
+            if (k < kmin - tol).all() or (k > kmax + tol).all():
+                return []
+
         # Gather all the unique candidates for vertices; all intersections
-        # between all boundaries, essentially
-        for line in self._boundaries():
-            for p in line._boundary_intersections(tlim, xlim):
-                if p not in vertices:
-                    vertices.append(p)
-        # Corners of the bounds, too
-        for tcorner in tlim:
-            for xcorner in xlim:
-                corner = STVector(tcorner, xcorner)
-                if corner not in vertices:
-                    vertices.append(corner)
+        # between all boundaries, essentially. Corners of the bounds, too.
+        candidates = [c for line in self._boundaries()
+            for c in line._boundary_crossing_coords(tlim, xlim)]
+        candidates += corners
+        # Look up already-seen points by their rounded coordinates, rather
+        # than comparing against every point gathered so far
+        vertices = []
+        seen = set()
+        for t, x, precision in candidates:
+            key = (round(t, precision), round(x, precision))
+            if key not in seen:
+                seen.add(key)
+                vertices.append((t, x, precision))
 
         # Filter out candidate points, keeping only those that are both in
-        # bounds, and inside the HalfRibbon region
-        vertices = [p for p in vertices if
-            (p._in_bounds(tlim, xlim) and self._point_inside(p))]
+        # bounds, and inside the region. Check all the candidates at once.
+        t, x, precision = np.array(vertices, dtype=float).T
+        tol = _tolerance(precision)
+        # Compare up to the precision of both the lines and each point
+        inside_tol = np.maximum(tol, _tolerance(self._precision()))
+        keep = (_in_bounds_mask(t, x, tol, tlim, xlim)
+            & self._inside_mask(t, x, inside_tol))
+        vertices = [v for v, kept in zip(vertices, keep.tolist()) if kept]
         # If no vertices, just return empty
         if not vertices:
-            return vertices
+            return []
         # Otherwise, order the vertices by the angle they make with the
-        # centroid of the polygon
-        tvals, xvals = tuple(zip(*vertices))
-        t_center = sum(tvals) / len(tvals)
-        x_center = sum(xvals) / len(xvals)
-        return sorted(vertices, key=lambda v: atan2(
-            v.t - t_center, v.x - x_center))
+        # centroid of the polygon. There are only ever a handful of vertices,
+        # which is too few for NumPy to beat a plain sort.
+        t_center = sum(v[0] for v in vertices) / len(vertices)
+        x_center = sum(v[1] for v in vertices) / len(vertices)
+        vertices.sort(key=lambda v: atan2(v[0] - t_center, v[1] - x_center))
+        return [STVector._from_components(*vertex) for vertex in vertices]
 
     def draw(self, plotter, tlim=geomrc['tlim'], xlim=geomrc['xlim'], **kwargs):
         kwargs = {**self.draw_options, **kwargs}
@@ -939,8 +1364,12 @@ class HalfRibbon(Ribbon):
             ray1.direction().t * ray2.direction().t < 0 or
             ray1.direction().x * ray2.direction().x < 0):
             raise ValueError('Rays must be parallel')
-        super().__init__(copy.deepcopy(ray1), copy.deepcopy(ray2),
-            tag=tag, draw_options=draw_options)
+        # The Ribbon constructor makes its own copies
+        super().__init__(ray1, ray2, tag=tag, draw_options=draw_options)
+        # Cached line between the ray anchors, and the anchor coordinates it
+        # was built from. See _boundaries().
+        self._separation_line = None
+        self._separation_key = None
 
     def append(self, other):
         raise TypeError("Cannot append to object of type 'HalfRibbon'")
@@ -948,46 +1377,38 @@ class HalfRibbon(Ribbon):
     """Get a list of hard boundaries (ray anchors and line boundaries)"""
     def _boundaries(self):
         # Add the separation line between the two Ray anchors as a hard
-        # boundary
-        direction = self[1].point() - self[0].point()
-        return super()._boundaries() + [Line(direction, self[0].point())]
-
-    """Test whether a point lies between the two ray boundaries"""
-    def _point_inside(self, point):
-        def dotprod(vec1, vec2):
-            return sum([v1*v2 for v1, v2 in zip(vec1, vec2)])
-
-        # Compare up to the precision of the two rays and the point
-        precision = min(self[0].precision(), self[1].precision())
-        try:    # If point is an STVector
-            precision = min(precision, point.precision)
-        except:
-            pass
-
+        # boundary. Only rebuild it if the anchors have moved since last time.
+        anchor1, anchor2 = self[0].point(), self[1].point()
+        key = (anchor1.t, anchor1.x, anchor2.t, anchor2.x)
+        if key != self._separation_key:
+            self._separation_line = Line(anchor2 - anchor1, anchor1)
+            self._separation_key = key
+        return super()._boundaries() + [self._separation_line]
+
+    def _inside_mask(self, t, x, tol):
+        """Test whether points lie between the two ray boundaries"""
+        anchor = self[0].point()
         # Get a normal vector to the line connecting the two anchors of the
         # HalfRibbon's rays. Namely, get the separation vector, then swap the
         # components and make one of them negative. There are two options.
         # Pick the normal vector that points outwards from the interior;
         # i.e. the dot product between the normal vector and the ray direction
-        # vectors should be negative.
-        sep_vec = self[1].point() - self[0].point()
-        normal_vecs = [STVector(-sep_vec[1], sep_vec[0]),
-                       STVector(sep_vec[1], -sep_vec[0])]
-        # Pick the normal vector that points outward.
-        # The equality is for when the two rays coincide; the normal vectors
-        # will both either be zero or orthogonal to the rays, so neither will
-        # get filtered out. Just pick the first one; it won't matter in this
-        # case.
-        normal_vec = [n for n in normal_vecs
-            if dotprod(n, self[0].direction()) <= 0][0]
+        # vectors should be nonpositive.
+        # When the two rays coincide, the normal vector will either be zero or
+        # orthogonal to the rays, so either option works.
+        sep_t = self[1].point().t - anchor.t
+        sep_x = self[1].point().x - anchor.x
+        normal_t, normal_x = -sep_x, sep_t
+        direction = self[0].direction()
+        if normal_t*direction.t + normal_x*direction.x > 0:
+            normal_t, normal_x = -normal_t, -normal_x
 
         # Get the displacement vector from the point to one of the ray's
         # anchors (it doesn't matter which). The point is on the "interior"
         # side of the anchors if and only if the dot product between this
         # separation vector and the normal vector is nonnegative.
         #
-        # The full Ribbon's _point_inside method can check for whether or not
+        # The full Ribbon's _inside_mask method can check for whether or not
         # the point lies laterally between the two rays
-        disp_vec = self[0].point() - STVector(point)
-        return (round(dotprod(disp_vec, normal_vec), precision) >= 0
-            and super()._point_inside(point))
+        disp_dotprod = (anchor.t - t)*normal_t + (anchor.x - x)*normal_x
+        return (disp_dotprod >= -tol) & super()._inside_mask(t, x, tol)
@@ -1,6 +1,11 @@
 """Core graphics-generation code for spacetime plots."""
 
+import os
+
+import matplotlib
+
 graphrc = {
+    'batch': bool(os.environ.get('SPECREL_BATCH')),
     'fig': None,
     'ax': None,
     'axs': None,
@@ -15,6 +20,7 @@ graphrc = {
     'anim.fps': 50,
     'anim.display_current': True,
     'anim.display_current_decimals': 3,
+    'anim.blit': False,
     'anim.time.ct_per_sec': 1,
     'anim.time.instant_pause_time': 1,
     'anim.transform.time': 0,
@@ -27,6 +33,13 @@ graphrc = {
 
 ## Items
 #### Top-level
+- **batch**: `True` if the `SPECREL_BATCH` environment variable is set to a
+    nonempty value, otherwise `False`
+    - Flag for batch (headless) rendering. In batch mode, `show` methods do
+        nothing, so scripts can save their plots and animations without
+        blocking on interactive windows. If `SPECREL_BATCH` is set, the
+        non-interactive Agg backend is also selected when `specrel.graphics`
+        is first imported.
 - **fig**: `None`
     - Matplotlib figure to draw on.
 - **ax**: `None`
@@ -60,6 +73,12 @@ graphrc = {
         in each animation frame.
 - **anim.display_current_decimals**: 3
     - Number of decimals to display the current control value to.
+- **anim.blit**: False
+    - Flag for using Matplotlib blitting during interactive playback, which
+        only redraws the contents of each axis instead of the whole figure.
+        Saved animations are always fully redrawn. Titles outside the axes
+        (including the current control value) aren't refreshed on screen
+        while blitting.
 - **anim.time.ct_per_sec**: 1
     - Amount of time to pass within an animation for every second of real time.
 - **anim.time.instant_pause_time**: 1
@@ -73,3 +92,7 @@ graphrc = {
 - **anim.worldline.current_time_color**: 'red'
     - Matplotlib color for the line of current time in animated spacetime plot.
 """
+
+if graphrc['batch']:
+    # Render headlessly; nothing is ever shown in batch mode
+    matplotlib.use('Agg')
@@ -2,13 +2,25 @@
 special relativity."""
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
 import math
 
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
+from matplotlib.path import Path
+from matplotlib.transforms import TransformedPath
 
 from specrel.graphics import graphrc
 
+@lru_cache(maxsize=16)
+def _frame_val_decimals(stepsize):
+    """Number of decimals to round frame values to for a given stepsize"""
+    # Round to the same order of magnitude (one smaller for safety) as the
+    # stepsize to ensure precision, but to mitigate floating-point error.
+    # The stepsize rarely changes, so this is cached rather than recomputed
+    # for every frame.
+    return 1 - int(math.floor(math.log10(abs(stepsize))))
+
 class FigureCreator:
     """Something that can create and own a figure.
 
@@ -89,6 +101,45 @@ class STPlotter(SingleAxisFigureCreator, ABC):
         """
         raise NotImplementedError
 
+    def draw_points(self, points, **kwargs):
+        """Draws many untagged spacetime points that share the same style. By
+        default, draws each point individually; plotters can override this to
+        draw them all at once.
+
+        Args:
+            points (list): List of `specrel.geom.STVector` objects to draw.
+            **kwargs: Matplotlib plot keyword arguments.
+        """
+        for point in points:
+            self.draw_point(point, None, **kwargs)
+
+    def draw_line_segments(self, segments, **kwargs):
+        """Draws many untagged line segments that share the same style. By
+        default, draws each segment individually; plotters can override this
+        to draw them all at once.
+
+        Args:
+            segments (list): List of (`point1`, `point2`) endpoint pairs. See
+                `specrel.graphics.basegraph.STPlotter.draw_line_segment`.
+            **kwargs: Matplotlib plot keyword arguments.
+        """
+        for point1, point2 in segments:
+            self.draw_line_segment(point1, point2, None, **kwargs)
+
+    def draw_polyline(self, points, tag, **kwargs):
+        """Draws line segments connecting a sequence of spacetime points. By
+        default, draws each segment individually; plotters can override this
+        to draw them all at once.
+
+        Args:
+            points (list): List of `specrel.geom.STVector` objects to connect,
+                in order.
+            tag (str): Tag to draw with each segment.
+            **kwargs: Matplotlib plot keyword arguments.
+        """
+        for point1, point2 in zip(points[:-1], points[1:]):
+            self.draw_line_segment(point1, point2, tag, **kwargs)
+
     @abstractmethod
     def draw_shaded_polygon(self, vertices, tag, **kwargs):
         """Draws a shaded polygon in spacetime.
@@ -108,9 +159,12 @@ class STPlotter(SingleAxisFigureCreator, ABC):
     @staticmethod
     def _decouple_stvectors(stvectors):
         """Separate time and space values in a list of STVectors."""
-        if stvectors:
-            return tuple(zip(*stvectors))
-        return tuple(), tuple()
+        # Reading the components directly is much faster than unpacking each
+        # STVector through its iterator, but also accept plain (t, x) pairs
+        try:
+            return [p.t for p in stvectors], [p.x for p in stvectors]
+        except AttributeError:
+            return [p[0] for p in stvectors], [p[1] for p in stvectors]
 
     @abstractmethod
     def set_lims(self, tlim, xlim):
@@ -215,11 +269,7 @@ class BaseAnimator(ABC):
             float:
                 Value of the frame.
         """
-        # Round to the same order of magnitude (one smaller for safety) as the
-        # stepsize to ensure precision, but to mitigate floating-point error
-        def order_of_mag(x):
-            return int(math.floor(math.log10(abs(x))))
-        return round(idx * self.stepsize, 1-order_of_mag(self.stepsize))
+        return round(idx * self.stepsize, _frame_val_decimals(self.stepsize))
 
     @abstractmethod
     def init_func(self):
@@ -259,9 +309,11 @@ class BaseAnimator(ABC):
         return self._frame_lim
 
     def _get_frame_list(self):
-        """Get a full list of all frame values to be played in the animation."""
+        """Get a full list of all frame values to be played in the animation.
+        This is a lazy `range`, since FuncAnimation only needs to iterate over
+        it."""
         frame_lim = self.get_frame_lim()
-        return list(range(frame_lim[0], frame_lim[1]+1))
+        return range(frame_lim[0], frame_lim[1]+1)
 
     def animate(self):
         """Synthesize an animation. If an animation was already synthesized and
@@ -272,15 +324,41 @@ class BaseAnimator(ABC):
         """
         # Only create a new animation if the cache is empty
         if self._cached_anim is None:
-            self._cached_anim = FuncAnimation(self.fig, self.update,
-                init_func=self.init_func,
+            blit = graphrc['anim.blit']
+            update, init_func = self.update, self.init_func
+            if blit:
+                # Blitting needs a flat list of artists drawn on axes
+                update = lambda frame: self._flatten_artists(
+                    self.update(frame))
+                init_func = lambda: self._flatten_artists(self.init_func())
+            self._cached_anim = FuncAnimation(self.fig, update,
+                init_func=init_func,
                 frames=self._get_frame_list(),
                 interval=1e3/self.fps,
-                repeat=False)
+                repeat=False,
+                blit=blit)
         return self._cached_anim
 
+    @classmethod
+    def _flatten_artists(cls, artists):
+        """Flatten arbitrarily nested lists of artists, dropping any that
+        aren't drawn on a set of axes (e.g. figure titles), since those can't
+        be blitted."""
+        if not isinstance(artists, (list, tuple)):
+            artists = [artists]
+        flattened = []
+        for artist in artists:
+            if isinstance(artist, (list, tuple)):
+                flattened += cls._flatten_artists(artist)
+            elif getattr(artist, 'axes', None) is not None:
+                flattened.append(artist)
+        return flattened
+
     def show(self):
-        """Play the animation in interactive mode."""
+        """Play the animation in interactive mode. Does nothing in batch mode;
+        see `specrel.graphics.graphrc`."""
+        if graphrc['batch']:
+            return
         self.animate()
         plt.show()
 
@@ -315,6 +393,10 @@ class WorldlinePlotter(STPlotter):
             relative to the axis sizes.
     """
 
+    # Bounding box style for tags on line segments and shaded polygons.
+    # Matplotlib copies it when making each tag, so it can be shared.
+    _TAG_BBOX = {'boxstyle': 'round', 'ec': 'black', 'fc': (1, 1, 1, 0.5)}
+
     def __init__(self,
         fig=graphrc['fig'],
         ax=graphrc['ax'],
@@ -333,7 +415,15 @@ class WorldlinePlotter(STPlotter):
 
     def _prepare_ax(self):
         """Do any axis preparation before drawing stuff."""
-        self.ax.grid(self.grid)
+        # Setting the grid is slow, since it touches every tick, so only do it
+        # if the axis doesn't already show the right grid. Check the axis
+        # itself, since it may have been cleared or shared with other plotters.
+        grid = bool(self.grid)
+        if (self.ax.xaxis.majorTicks[0].gridline.get_visible() == grid
+            and self.ax.yaxis.majorTicks[0].gridline.get_visible() == grid
+            and self.ax.get_axisbelow() is True):
+            return
+        self.ax.grid(grid)
         # Ensure grid lines are behind other objects
         self.ax.set_axisbelow(True)
 
@@ -358,6 +448,24 @@ class WorldlinePlotter(STPlotter):
             self.ax.text(point[1], point[0], tag)
         self._set_legend()
 
+    def draw_points(self, points, **kwargs):
+        """See `specrel.graphics.basegraph.STPlotter.draw_points`. All the
+        points are drawn as a single Matplotlib line with no line style.
+
+        Kwargs:
+            linestyle: Forced to be `'None'`
+            marker: Default is `'.'`.
+        """
+        if not points:
+            return
+        self._prepare_ax()
+        marker = kwargs.pop('marker', '.')
+        # Force linestyle to be none for points
+        kwargs['linestyle'] = 'None'
+        tvals, xvals = self._decouple_stvectors(points)
+        self.ax.plot(xvals, tvals, marker=marker, **kwargs)
+        self._set_legend()
+
     def draw_line_segment(self, point1, point2, tag=None, **kwargs):
         """See `specrel.graphics.basegraph.STPlotter.draw_line_segment`.
 
@@ -368,11 +476,53 @@ class WorldlinePlotter(STPlotter):
         # Ignore the "marker" parameter
         kwargs.pop('marker', None)
         self.ax.plot((point1[1], point2[1]), (point1[0], point2[0]), **kwargs)
-        # Put the tag at the midpoint
         if tag:
-            self.ax.text((point1[1] + point2[1])/2, (point1[0] + point2[0])/2,
-                tag, ha='center', va='center', bbox={'boxstyle': 'round',
-                    'ec': 'black', 'fc': (1, 1, 1, 0.5)})
+            self._draw_segment_tag(point1, point2, tag)
+        self._set_legend()
+
+    def _draw_segment_tag(self, point1, point2, tag):
+        """Put a line segment's tag at its midpoint"""
+        self.ax.text((point1[1] + point2[1])/2, (point1[0] + point2[0])/2,
+            tag, ha='center', va='center', bbox=self._TAG_BBOX)
+
+    def draw_line_segments(self, segments, **kwargs):
+        """See `specrel.graphics.basegraph.STPlotter.draw_line_segments`. All
+        the segments are drawn as a single Matplotlib line, broken up by NaN
+        values.
+
+        Kwargs:
+            marker: Forced to be `None`.
+        """
+        if not segments:
+            return
+        self._prepare_ax()
+        # Ignore the "marker" parameter
+        kwargs.pop('marker', None)
+        xvals, tvals = [], []
+        for point1, point2 in segments:
+            xvals += [point1[1], point2[1], math.nan]
+            tvals += [point1[0], point2[0], math.nan]
+        # Leave off the trailing NaN separator
+        self.ax.plot(xvals[:-1], tvals[:-1], **kwargs)
+        self._set_legend()
+
+    def draw_polyline(self, points, tag=None, **kwargs):
+        """See `specrel.graphics.basegraph.STPlotter.draw_polyline`. All the
+        segments are drawn as a single Matplotlib line.
+
+        Kwargs:
+            marker: Forced to be `None`.
+        """
+        if len(points) < 2:
+            return
+        self._prepare_ax()
+        # Ignore the "marker" parameter
+        kwargs.pop('marker', None)
+        tvals, xvals = self._decouple_stvectors(points)
+        self.ax.plot(xvals, tvals, **kwargs)
+        if tag:
+            for point1, point2 in zip(points[:-1], points[1:]):
+                self._draw_segment_tag(point1, point2, tag)
         self._set_legend()
 
     def draw_shaded_polygon(self, vertices, tag=None, **kwargs):
@@ -389,8 +539,7 @@ class WorldlinePlotter(STPlotter):
         # Put tag at the centroid
         if vertices and tag:
             self.ax.text(sum(xvals)/len(xvals), sum(tvals)/len(tvals), tag,
-                ha='center', va='center', bbox={'boxstyle': 'round',
-                    'ec': 'black', 'fc': (1, 1, 1, 0.5)})
+                ha='center', va='center', bbox=self._TAG_BBOX)
         self._set_legend()
 
     def set_lims(self, tlim, xlim):
@@ -410,16 +559,21 @@ class WorldlinePlotter(STPlotter):
         self.ax.set_xlim(padded_xlim)
         self.ax.set_ylim(padded_tlim)
 
-        # Clip lines and polygons objects to the actual limits
-        clipbox = self.ax.fill([xlim[0], xlim[0], xlim[1], xlim[1]],
-            [tlim[0], tlim[1], tlim[1], tlim[0]], color='None')[0]
+        # Clip lines and polygons objects to the actual limits. Build the clip
+        # path directly in data coordinates rather than adding a patch to the
+        # axes and removing it again. All the artists can share it.
+        clip_path = TransformedPath(Path([
+            (xlim[0], tlim[0]), (xlim[0], tlim[1]), (xlim[1], tlim[1]),
+            (xlim[1], tlim[0]), (xlim[0], tlim[0])], closed=True),
+            self.ax.transData)
         # Only clip lines, not points
-        for artist in [ln for ln in self.ax.lines if len(ln.get_xdata()) > 1] \
-            + self.ax.patches[:-1]:
-            artist.set_clip_path(clipbox)
-        self.ax.patches.pop()
+        for artist in [ln for ln in self.ax.lines if len(ln.get_xdata()) > 1
+            and ln.get_linestyle() != 'None'] + list(self.ax.patches):
+            artist.set_clip_path(clip_path)
 
     def show(self):
+        if graphrc['batch']:
+            return
         plt.show()
 
     def set_labels(self):
@@ -3,6 +3,7 @@ animations in special relativity.
 """
 
 from abc import abstractmethod
+from concurrent.futures import ProcessPoolExecutor
 import copy
 import os
 import subprocess
@@ -223,10 +224,12 @@ class MultiTimeAnimator(MultiAnimator, sanim.TimeAnimator):
         return frame_pause_flags
 
     def _get_frame_list(self):
+        # Merge the pause flags of all animators once, rather than per frame
+        frame_pause_flags = self._get_frame_pause_flags()
         # Insert pause frames where necessary
         return [f for f in MultiAnimator._get_frame_list(self)
             for repeat in range(
-                self._pause_frames if self._get_frame_pause_flags()[f] else 1)]
+                self._pause_frames if frame_pause_flags[f] else 1)]
 
 class MultiTransformAnimator(MultiAnimator):
     """Runs multiple Lorentz transform animations simultaneously on different
@@ -361,6 +364,11 @@ class Rewinder(bgraph.BaseAnimator):
 def concat_demuxer(input_files, output_file):
     """Concatenate video files.
 
+    The videos are joined with a stream copy rather than re-encoded, so all of
+    the input files must share the same codec, pixel format, frame rate and
+    resolution. Save every input with the same writer options to guarantee
+    this.
+
     Args:
         input_files (list): List of input file names.
         output_file (str): Output file name.
@@ -380,3 +388,44 @@ def concat_demuxer(input_files, output_file):
         os.remove(tempfilename)
     except OSError as e:
         print(f"[Error] {e.strerror}: '{tempfilename}'")
+
+def _build_and_save(animator_factory, filename, save_kwargs):
+    """Build an animator and save its animation. Runs in a worker process."""
+    # Nothing is ever displayed from a worker, so use a non-interactive backend
+    plt.switch_backend('Agg')
+    animator = animator_factory()
+    animator.save(filename, **save_kwargs)
+    plt.close(animator.fig)
+
+def save_many(animator_factories, filenames, max_workers=None, **kwargs):
+    """Build and save several independent animations in parallel, each in its
+    own process.
+
+    Matplotlib figures can't be sent between processes, so each animation is
+    described by a factory that builds the animator inside the worker. On
+    platforms that start processes by spawning (Windows and macOS), scripts
+    calling this function must guard their entry point with
+    `if __name__ == '__main__':`.
+
+    Args:
+        animator_factories (list): Picklable callables taking no arguments,
+            each returning a `specrel.graphics.basegraph.BaseAnimator`, e.g.
+            `functools.partial(specrel.visualize.stanimate, scene, fps=50)`.
+        filenames (list): Output file name for each animation.
+        max_workers (int, optional): Maximum number of worker processes. If
+            `None`, the number of processors on the machine is used.
+        **kwargs: Keyword arguments to the `save` method of every animator.
+
+    Raises:
+        ValueError:
+            If the number of factories and file names don't match.
+    """
+    if len(animator_factories) != len(filenames):
+        raise ValueError('Number of animator factories and file names must '
+            + 'match.')
+    with ProcessPoolExecutor(max_workers) as executor:
+        futures = [executor.submit(_build_and_save, factory, filename, kwargs)
+            for factory, filename in zip(animator_factories, filenames)]
+        # Surface any errors raised in the workers
+        for future in futures:
+            future.result()
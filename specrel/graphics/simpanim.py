@@ -5,7 +5,9 @@ import copy
 import warnings
 
 import matplotlib.pyplot as plt
+import numpy as np
 
+import specrel.geom as geom
 from specrel.graphics import graphrc
 import specrel.graphics.basegraph as bgraph
 
@@ -258,10 +260,10 @@ class WorldlineAnimator(STAnimator):
     def _init_frame(self, idx):
         super()._init_frame(idx)
 
-        # Draw the current line of constant time
-        self.frame_plotters[idx] += [
-            lambda: self._draw_current_time(self.calc_frame_val(idx))
-        ]
+        # Draw the current line of constant time. The frame's time value is
+        # fixed, so compute it once here rather than every time it's drawn.
+        t = self.calc_frame_val(idx)
+        self.frame_plotters[idx] += [lambda: self._draw_current_time(t)]
 
     def draw_point(self, point, tag=None, **kwargs):
         super().draw_point(point, tag, **kwargs)
@@ -344,6 +346,9 @@ class ObjectAnimator(STAnimator):
             display_current_time_decimals=display_current_time_decimals,
             title=title)
         self.tag_height = tag_height
+        # Artists drawn for the current frame only; everything else on the axis
+        # is set up once and persists between frames
+        self._frame_artists = []
 
     def _disable_y_axis(self):
         """Hide the y-axis ticks because they mean nothing."""
@@ -351,27 +356,34 @@ class ObjectAnimator(STAnimator):
         self.ax.set_ylim((-0.5, 0.5))
         self.ax.set_yticks([])
 
+    def _remove_frame_artists(self):
+        """Remove the artists drawn for the previous frame, leaving the axis
+        setup intact."""
+        for artist in self._frame_artists:
+            artist.remove()
+        self._frame_artists = []
+        # Restart the color cycle, so that uncolored objects keep the same
+        # colors from frame to frame
+        self.ax.set_prop_cycle(None)
+        legend = self.ax.get_legend()
+        if legend is not None:
+            legend.remove()
+
     def init_func(self):
+        self._remove_frame_artists()
+        # Static axis setup only needs to happen once, not every frame
         self._disable_y_axis()
         self._set_labels()
         self.ax.set_xlim(self.xlim)
+        if self.grid:
+            self._set_grid()
         return super().init_func()
 
     def _init_frame(self, idx):
         super()._init_frame(idx)
 
-        # Wipe the axis before doing anything else
-        self.frame_plotters[idx].insert(0, self.ax.clear)
-        # Perform other frame setup
-        self.frame_plotters[idx] += [
-            lambda: self.ax.set_xlim(self.xlim),
-            # Disable the y axis because it's meaningless
-            self._disable_y_axis,
-            self._set_labels,
-        ]
-        if self.grid:
-            # Set the x grid
-            self.frame_plotters[idx] += [self._set_grid]
+        # Wipe the last frame's objects before doing anything else
+        self.frame_plotters[idx].insert(0, self._remove_frame_artists)
 
     def _set_grid(self):
         """Set the x-grid."""
@@ -390,19 +402,23 @@ class ObjectAnimator(STAnimator):
         # Force linestyle to be none for a point
         kwargs['linestyle'] = 'None'
         def point_drawer():
-            self.ax.plot(xval, 0, marker=marker, **kwargs)
+            self._frame_artists += self.ax.plot(xval, 0, marker=marker,
+                **kwargs)
             if tag:
-                self.ax.text(xval, self.tag_height, tag)
+                self._frame_artists.append(
+                    self.ax.text(xval, self.tag_height, tag))
         return point_drawer
 
     def _generate_line_drawer(self, xval1, xval2, tag, **kwargs):
         """Factory function for line drawing functions. Needed to save
         persistent copies of xval calculated in loops."""
         def line_drawer():
-            self.ax.plot([xval1, xval2], [0, 0], **kwargs)
+            self._frame_artists += self.ax.plot([xval1, xval2], [0, 0],
+                **kwargs)
             if tag:
-                self.ax.text((xval1 + xval2)/2, self.tag_height, tag,
-                    ha='center')
+                self._frame_artists.append(
+                    self.ax.text((xval1 + xval2)/2, self.tag_height, tag,
+                        ha='center'))
         return line_drawer
 
     def _draw_legend(self):
@@ -425,6 +441,7 @@ class ObjectAnimator(STAnimator):
     def _interpolate(self, point1, point2, t):
         """Linearly interpolate the position value at a specific time value
         between two points. Assumes the two points have different time values.
+        `t` can also be a NumPy array of time values.
         """
         return point1[1] + \
             (t - point1[0]) / (point2[0] - point1[0]) * (point2[1] - point1[1])
@@ -437,17 +454,6 @@ class ObjectAnimator(STAnimator):
             return None
         return self._interpolate(point1, point2, t)
 
-    def _loose_interpolate(self, point1, point2, t):
-        """Only looking at the internal frame resolution, if the time value
-        isn't between the two points, return None."""
-        # Do bounds checking at the internal frame resolution
-        snapped_t, snapped_t1, snapped_t2 = [
-            self.calc_frame_val(val) for val in [t, point1[0], point2[0]]]
-        if (snapped_t < min(snapped_t1, snapped_t2) or
-            snapped_t > max(snapped_t1, snapped_t2)):
-            return None
-        return self._interpolate(point1, point2, t)
-
     def draw_line_segment(self, point1, point2, tag=None, **kwargs):
         super().draw_line_segment(point1, point2, tag, **kwargs)
 
@@ -465,18 +471,27 @@ class ObjectAnimator(STAnimator):
         # Otherwise, spread out the points across different frames
         start_idx = self.calc_frame_idx(min(point1[0], point2[0]))
         end_idx = self.calc_frame_idx(max(point1[0], point2[0]))
-        for idx in range(start_idx, end_idx+1):
-            snapped_tval = self.calc_frame_val(idx)
-            # The bounds checking won't screw up the general line shape, so
-            # use loose interpolation
-            xval = self._loose_interpolate(point1, point2, snapped_tval)
-            if xval is not None:
-                self.frame_plotters[idx] += [
-                    self._generate_point_drawer(xval, tag, **kwargs)
-                ]
-                # Ensure the legend is updated on each modified frame
-                if self.legend:
-                    self.frame_plotters[idx] += [self._draw_legend]
+        frame_idxs = np.arange(start_idx, end_idx+1)
+        snapped_tvals = np.array(
+            [self.calc_frame_val(idx) for idx in frame_idxs.tolist()])
+        # Do bounds checking at the internal frame resolution. The bounds
+        # checking won't screw up the general line shape, so use loose
+        # interpolation.
+        snapped_t1, snapped_t2 = sorted(
+            [self.calc_frame_val(val) for val in [point1[0], point2[0]]])
+        in_bounds = np.array([snapped_t1 <= self.calc_frame_val(val)
+            <= snapped_t2 for val in snapped_tvals.tolist()], dtype=bool)
+        frame_idxs = frame_idxs[in_bounds]
+        # Interpolate the positions for every remaining frame at once
+        xvals = self._interpolate(point1, point2,
+            snapped_tvals[in_bounds]).tolist()
+        for idx, xval in zip(frame_idxs.tolist(), xvals):
+            self.frame_plotters[idx] += [
+                self._generate_point_drawer(xval, tag, **kwargs)
+            ]
+            # Ensure the legend is updated on each modified frame
+            if self.legend:
+                self.frame_plotters[idx] += [self._draw_legend]
 
     def draw_shaded_polygon(self, vertices, tag=None, **kwargs):
         # If no vertices, just return
@@ -648,20 +663,74 @@ class TransformAnimator(bgraph.BaseAnimator, bgraph.SingleAxisFigureCreator):
             title=None,
             **stanimator_options)
         self._stanimator_frame = self._stanimator.calc_frame_idx(time)
+        self._frame_coords = None
 
     def clear(self):
         self._stanimator.clear()
+        # Precomputed coordinates of the object in every frame
+        self._frame_coords = None
 
     def init_func(self):
+        # Recompute the frame coordinates in case the object has changed
+        self._frame_coords = None
         return [self.ax]
 
+    def _precompute_frames(self):
+        """Lorentz transform the object's coordinates for every frame at once,
+        and set up a single working copy of the object to hold the coordinates
+        of whichever frame is being drawn."""
+        self._working_obj = copy.deepcopy(self.transformable)
+        leaves = list(self._working_obj._transform_leaves())
+        self._working_leaves = [p for p, _ in leaves]
+        first_frame, last_frame = self.get_frame_lim()
+        self._first_frame = first_frame
+        if (not geom._transforms_by_leaves(self._working_obj)
+            or any(is_position is None for _, is_position in leaves)):
+            # Objects with their own transformation logic can't be
+            # precomputed, so leave every frame to be transformed on demand
+            self._frame_coords = np.empty((0, 0, 2))
+            return
+
+        # Column vectors of the velocity and gamma factor of each frame
+        velocities = np.array([self.calc_frame_val(f)
+            for f in range(first_frame, last_frame+1)], dtype=float)[:, None]
+        gammas = geom.STVector.gamma_factor(velocities)
+
+        # Only positions are shifted by the origin; displacements are not
+        t0, x0 = self.origin
+        offsets = np.array([(t0, x0) if is_position else (0, 0)
+            for _, is_position in leaves], dtype=float).reshape(-1, 2)
+        coords = np.array([(p.t, p.x) for p in self._working_leaves],
+            dtype=float).reshape(-1, 2)
+        dt = coords[:, 0] - offsets[:, 0]
+        dx = coords[:, 1] - offsets[:, 1]
+        # Shape (number of frames, number of STVectors, 2)
+        self._frame_coords = np.stack([
+            gammas*(dt - velocities*dx) + offsets[:, 0],
+            gammas*(dx - velocities*dt) + offsets[:, 1],
+        ], axis=-1)
+
+    def _transformed_obj(self, frame):
+        """Returns the object Lorentz transformed to a given frame."""
+        if self._frame_coords is None:
+            self._precompute_frames()
+        idx = frame - self._first_frame
+        if not 0 <= idx < len(self._frame_coords):
+            # Not precomputed, so transform a fresh copy
+            return geom.lorentz_transformed(self.transformable,
+                self.calc_frame_val(frame), self.origin)
+        for p, (t, x) in zip(self._working_leaves,
+            self._frame_coords[idx].tolist()):
+            p.t = t
+            p.x = x
+        return self._working_obj
+
     def update(self, frame):
         self._stanimator.clear()
         # Transform the object with the current velocity and plot it with some
         # STAnimator
         v = self.calc_frame_val(frame)
-        obj = copy.deepcopy(self.transformable)
-        obj.lorentz_transform(v, origin=self.origin)
+        obj = self._transformed_obj(frame)
         obj.draw(plotter=self._stanimator, tlim=self.tlim, xlim=self.xlim)
         self._stanimator.init_func()
         try:
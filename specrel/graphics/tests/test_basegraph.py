@@ -1,8 +1,10 @@
+import math
 import unittest
 
 import matplotlib.pyplot as plt
 from matplotlib.patches import BoxStyle
 
+import specrel.geom as geom
 import specrel.graphics.basegraph as bgraph
 
 class SingleAxisFigureCreatorTests(unittest.TestCase):
@@ -63,6 +65,45 @@ class WorldlinePlotterTests(unittest.TestCase):
         self.assertEqual(tag_box.get_ec(), (0, 0, 0, 1))
         self.assertEqual(tag_box.get_fc(), (1, 1, 1, 0.5))
     
+    def test_draw_points(self):
+        self.plotter.draw_points([(1, 2), (3, 4)], color='red')
+        self.assertEqual(len(self.plotter.ax.lines), 1)
+        pts = self.plotter.ax.lines[0]
+        self.assertEqual([list(d) for d in pts.get_data()], [[2, 4], [1, 3]])
+        self.assertEqual(pts.get_linestyle(), 'None')
+        self.assertEqual(pts.get_marker(), '.')
+        # Points aren't clipped to the limits
+        self.plotter.set_lims((0, 1), (0, 2))
+        self.assertIsNone(pts.get_clip_path())
+
+    def test_draw_line_segments(self):
+        self.plotter.draw_line_segments([((1, 2), (3, 4)), ((5, 6), (7, 8))])
+        self.assertEqual(len(self.plotter.ax.lines), 1)
+        xdata, tdata = [list(d) for d in self.plotter.ax.lines[0].get_data()]
+        self.assertEqual(xdata[:2] + xdata[3:], [2, 4, 6, 8])
+        self.assertEqual(tdata[:2] + tdata[3:], [1, 3, 5, 7])
+        self.assertTrue(math.isnan(xdata[2]) and math.isnan(tdata[2]))
+
+    def test_draw_polyline(self):
+        self.plotter.draw_polyline([(1, 2), (3, 4), (5, 6)], tag='poly')
+        self.assertEqual(len(self.plotter.ax.lines), 1)
+        xdata, tdata = [list(d) for d in self.plotter.ax.lines[0].get_data()]
+        self.assertEqual(xdata, [2, 4, 6])
+        self.assertEqual(tdata, [1, 3, 5])
+        # One tag per segment
+        self.assertEqual([tag.get_text() for tag in self.plotter.ax.texts],
+            ['poly', 'poly'])
+        self.assertEqual(self.plotter.ax.texts[1]._x, 5)
+        self.assertEqual(self.plotter.ax.texts[1]._y, 4)
+
+    def test_decouple_stvectors(self):
+        stvectors = [geom.STVector(1, 2), geom.STVector(3, 4)]
+        self.assertEqual(self.plotter._decouple_stvectors(stvectors),
+            ([1, 3], [2, 4]))
+        self.assertEqual(self.plotter._decouple_stvectors([(1, 2), (3, 4)]),
+            ([1, 3], [2, 4]))
+        self.assertEqual(self.plotter._decouple_stvectors([]), ([], []))
+
     def test_draw_shaded_polygon(self):
         self.plotter.draw_shaded_polygon([(0, 0), (0, 1), (1, 0)], tag='poly')
         poly = self.plotter.ax.patches[0]
@@ -79,12 +120,54 @@ class WorldlinePlotterTests(unittest.TestCase):
         self.assertEqual(tag_box.get_ec(), (0, 0, 0, 1))
         self.assertEqual(tag_box.get_fc(), (1, 1, 1, 0.5))
 
+    def test_grid(self):
+        self.plotter.grid = True
+        self.plotter.draw_point((1, 2))
+        self.assertTrue(self.plotter.ax.xaxis.get_gridlines()[0].get_visible())
+        # Changing the setting takes effect on the next draw
+        self.plotter.grid = False
+        self.plotter.draw_point((1, 2))
+        self.assertFalse(
+            self.plotter.ax.xaxis.get_gridlines()[0].get_visible())
+
+    def test_grid_after_clear(self):
+        self.plotter.grid = True
+        self.plotter.draw_point((1, 2))
+        self.plotter.ax.clear()
+        self.plotter.draw_point((1, 2))
+        self.assertTrue(self.plotter.ax.xaxis.get_gridlines()[0].get_visible())
+        self.assertTrue(self.plotter.ax.yaxis.get_gridlines()[0].get_visible())
+
+    def test_grid_shared_ax(self):
+        other = bgraph.WorldlinePlotter(ax=self.plotter.ax, grid=False)
+        self.plotter.grid = True
+        self.plotter.draw_point((1, 2))
+        other.draw_point((1, 2))
+        self.assertFalse(
+            self.plotter.ax.xaxis.get_gridlines()[0].get_visible())
+        self.plotter.draw_point((1, 2))
+        self.assertTrue(self.plotter.ax.xaxis.get_gridlines()[0].get_visible())
+
     def test_set_lims(self):
         self.plotter.draw_line_segment((1, 2), (2, 3))
         pt = self.plotter.ax.lines[0]
         self.plotter.set_lims((0, 1), (0, 2))
         self.assertEqual(self.plotter.ax.get_xlim(), (-0.1, 2.1))
         self.assertEqual(self.plotter.ax.get_ylim(), (-0.05, 1.05))
-        self.assertEqual(
-            [list(xy) for xy in pt.get_clip_path()._patch.get_xy()],
+        # The axes are linear, so the clip path is in data coordinates up to
+        # an affine transform
+        clip_path, _ = pt.get_clip_path().get_transformed_path_and_affine()
+        self.assertEqual([list(xy) for xy in clip_path.vertices],
             [[0, 0], [0, 1], [2, 1], [2, 0], [0, 0]])
+        # No leftover patches from making the clip path
+        self.assertEqual(len(self.plotter.ax.patches), 0)
+
+class BaseAnimatorTests(unittest.TestCase):
+    def test_flatten_artists(self):
+        fig, ax = plt.subplots()
+        ln, = ax.plot([0, 1], [0, 1])
+        suptitle = fig.suptitle('Title')
+        self.assertEqual(
+            bgraph.BaseAnimator._flatten_artists([suptitle, [ax, [ln]]]),
+            [ax, ln])
+        plt.close(fig)
@@ -1,3 +1,6 @@
+import functools
+import os
+import tempfile
 import unittest
 
 import specrel.geom as geom
@@ -176,3 +179,23 @@ class RewinderTests(unittest.TestCase):
         self.assertEqual([list(d) for d in tline.get_data()], [[0, 3], [0, 0]])
         self.assertEqual(pt.get_data(), (0, 0))
         self.assertEqual(title.get_text(), 'Title\nTime = 0.000 s')
+
+def _point_animator(tval):
+    anim = sanim.ObjectAnimator(fps=1, ct_per_sec=1)
+    geom.STVector(tval, 0).draw(anim)
+    return anim
+
+class SaveManyTests(unittest.TestCase):
+    def test_save_many(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            filenames = [os.path.join(tempdir, f'anim{i}.gif')
+                for i in range(2)]
+            canim.save_many(
+                [functools.partial(_point_animator, t) for t in [1, 2]],
+                filenames, max_workers=2, writer='pillow')
+            for filename in filenames:
+                self.assertTrue(os.path.isfile(filename))
+
+    def test_mismatched_lengths(self):
+        self.assertRaises(ValueError, canim.save_many,
+            [functools.partial(_point_animator, 0)], [])
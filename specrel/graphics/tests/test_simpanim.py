@@ -3,6 +3,7 @@ import unittest
 import matplotlib.pyplot as plt
 
 import specrel.geom as geom
+from specrel.graphics import graphrc
 import specrel.graphics.simpanim as sanim
 
 class WorldlineAnimatorTests(unittest.TestCase):
@@ -28,6 +29,13 @@ class WorldlineAnimatorTests(unittest.TestCase):
         self.assertEqual([list(xy) for xy in poly.get_xy()],
             [[0, 0], [1, 0], [0, 1], [0, 0]])
 
+    def test_init_func_keeps_grid(self):
+        # Redrawing after the axis is cleared must set the grid up again
+        self.animator._worldline_plotter.grid = True
+        self.animator.init_func()
+        self.animator.init_func()
+        self.assertTrue(self.animator.ax.xaxis.get_gridlines()[0].get_visible())
+
     def test_update(self):
         tline = self.animator.ax.lines[-1]
         self.animator.update(0)
@@ -67,6 +75,52 @@ class ObjectAnimatorBasicTests(unittest.TestCase):
         self.assertEqual([list(d) for d in poly.get_data()],
             [[0, 0], [0, 0]])
 
+    def test_update_keeps_axis_setup(self):
+        self.animator.update(0)
+        self.animator.update(1)
+        self.assertEqual(len(self.animator.ax.get_yticks()), 0)
+        self.assertEqual(self.animator.ax.get_xlim(), (0, 1))
+        self.assertEqual(len(self.animator.ax.lines), 2)
+
+    def test_update_keeps_colors(self):
+        # Uncolored objects get the same cycle colors in every frame
+        animator = sanim.ObjectAnimator(fps=1, ct_per_sec=1)
+        animator.draw_line_segment((0, 0), (2, 2))
+        animator.draw_line_segment((0, 1), (2, 3))
+        animator.set_lims((0, 2), (0, 3))
+        animator.init_func()
+        colors = []
+        for frame in range(3):
+            animator.update(frame)
+            colors.append([ln.get_color() for ln in animator.ax.lines])
+        animator.clear()
+        animator.close()
+        self.assertNotEqual(colors[0][0], colors[0][1])
+        self.assertEqual(colors, 3*colors[:1])
+
+class ObjectAnimatorLineSegmentTests(unittest.TestCase):
+    def setUp(self):
+        self.animator = sanim.ObjectAnimator(fps=10, ct_per_sec=1)
+
+    def tearDown(self):
+        self.animator.clear()
+        self.animator.close()
+
+    def test_loose_bounds_edge_frame(self):
+        self.animator.draw_line_segment((0.65, 0), (1.25, 1))
+        self.animator.set_lims((0.6, 1.3), (0, 1))
+        self.animator.init_func()
+        # Frame 6 (t = 0.6) snaps outside of the segment's snapped start time,
+        # so nothing is drawn there
+        self.animator.update(6)
+        self.assertEqual(len(self.animator.ax.lines), 0)
+        self.animator.update(7)
+        pt, = self.animator.ax.lines
+        self.assertAlmostEqual(pt.get_data()[0][0], 0.05/0.6)
+        self.animator.update(12)
+        pt, = self.animator.ax.lines
+        self.assertAlmostEqual(pt.get_data()[0][0], 0.55/0.6)
+
 """Tests specifically for polygon drawing logic"""
 class ObjectAnimatorPolygonTests(unittest.TestCase):
     def setUp(self):
@@ -149,3 +203,50 @@ class TransformAnimatorTests(unittest.TestCase):
         pt = self.animator.ax.lines[0]
         t, x = geom.lorentz_transformed(self.transformable, 3/5)
         self.assertEqual(pt.get_data(), (x, t))
+
+    def test_transformed_obj(self):
+        transformable = geom.Collection([geom.STVector(2, 3),
+            geom.Line((1, 1/2), (0, 1))])
+        animator = sanim.TransformAnimator(transformable, 3/5, origin=(1, 1),
+            fps=2, transition_duration=1)
+        for frame, v in zip(range(3), [0, 3/10, 3/5]):
+            expected = geom.lorentz_transformed(transformable, v, (1, 1))
+            obj = animator._transformed_obj(frame)
+            self.assertEqual(obj[0], expected[0])
+            self.assertEqual(obj[1], expected[1])
+        # The original object is untouched
+        self.assertEqual(transformable[0], (2, 3))
+        animator.close()
+
+    def test_transformed_obj_overridden(self):
+        class ReflectedSTVector(geom.STVector):
+            def lorentz_transform(self, velocity, origin=(0, 0)):
+                super().lorentz_transform(velocity, origin)
+                self.x = -self.x
+
+        transformable = geom.Collection([geom.STVector(2, 3),
+            ReflectedSTVector(2, 3)])
+        animator = sanim.TransformAnimator(transformable, 3/5, fps=2,
+            transition_duration=1)
+        for frame, v in zip(range(3), [0, 3/10, 3/5]):
+            obj = animator._transformed_obj(frame)
+            self.assertEqual(obj[0],
+                geom.lorentz_transformed(geom.STVector(2, 3), v))
+            self.assertEqual(obj[1],
+                geom.lorentz_transformed(ReflectedSTVector(2, 3), v))
+        animator.close()
+
+class BatchModeTests(unittest.TestCase):
+    def setUp(self):
+        self.animator = sanim.ObjectAnimator(fps=1, ct_per_sec=1)
+        self.animator.draw_point((0, 0))
+        self.old_batch = graphrc['batch']
+        graphrc['batch'] = True
+
+    def tearDown(self):
+        graphrc['batch'] = self.old_batch
+        self.animator.close()
+
+    def test_show_does_nothing(self):
+        self.animator.show()
+        self.assertIsNone(self.animator._cached_anim)
@@ -3,6 +3,7 @@ continuous change of some sort.
 """
 
 from matplotlib.colors import to_rgba
+import numpy as np
 
 import specrel.geom as geom
 
@@ -17,6 +18,16 @@ def _calc_colorgrad(x, point1, point2, color1, color2):
     xcolor = tuple([c1 + x*(c2 - c1) for c1, c2 in zip(color1, color2)])
     return xpoint, xcolor
 
+def _lerp(fracs, start, end):
+    """Linearly interpolate between two tuples (points or colors) at an array
+    of proportions, where 0 is the start and 1 is the end. Returns a list of
+    interpolated tuples, one for each proportion.
+    """
+    start = np.array(tuple(start), dtype=float)
+    end = np.array(tuple(end), dtype=float)
+    return [tuple(row) for row in
+        (start + np.outer(fracs, end - start)).tolist()]
+
 def _valid_color(col):
     """Checks whether an rgba value is a valid color or not."""
     for c in col:
@@ -83,22 +94,22 @@ def gradient_line(point1, point2, color1, color2, divisions=100,
         point1, point2, color1, color2, divisions = _colorgrad_extremes(
             point1, point2, color1, color2, divisions)
 
-    # Color gradient calculator for the given points and colors
-    def this_colorgrad(x):
-        return _calc_colorgrad(x, point1, point2, color1, color2)
-
     # Line direction vector
     direc = geom.STVector(point2) - geom.STVector(point1)
 
+    # Interpolate the division boundaries and the color at the middle of each
+    # division all at once
+    points = _lerp(np.arange(divisions + 1)/divisions, point1, point2)
+    grad_colors = _lerp((np.arange(divisions) + 1/2)/divisions,
+        to_rgba(color1), to_rgba(color2))
+
     grad = geom.Collection()
     # Monochromatic ray at the tail end of the gradient line
     grad.append(geom.Ray(-direc, point1,
         draw_options={'color': color1, **draw_options}))
     # The line segments comprising the color gradient
-    for i in range(divisions):
-        start_point, _ = this_colorgrad(i/divisions)
-        end_point, _ = this_colorgrad((i+1)/divisions)
-        _, grad_color = this_colorgrad((i+1/2)/divisions)
+    for start_point, end_point, grad_color in zip(
+        points[:-1], points[1:], grad_colors):
         grad.append(geom.line_segment(start_point, end_point,
             draw_options={'color': grad_color, **draw_options}))
     # Monochromatic ray at the head end of the gradient line
@@ -174,14 +185,19 @@ def longitudinal_gradient_ribbon(line1_endpoints, line2_endpoints, color1,
         geom.Ray(-direc2, start_point2),
         # Explicitly turn off edge coloring
         draw_options={'facecolor': color1, 'edgecolor': 'None', **draw_options}))
-    # Interior polygons comprising the color gradient
-    for i in range(divisions):
-        start_point1, _ = line1_colorgrad(i/divisions)
-        # Overlap bands by half a division
-        end_point1, _ = line1_colorgrad((i+1+1/2)/divisions)
-        start_point2, _ = line2_colorgrad(i/divisions)
-        end_point2, _ = line2_colorgrad((i+1+1/2)/divisions)
-        _, grad_color = line1_colorgrad((i+1/2)/divisions)
+    # Interior polygons comprising the color gradient, with all the vertices
+    # and colors interpolated at once
+    start_fracs = np.arange(divisions)/divisions
+    # Overlap bands by half a division
+    end_fracs = (np.arange(divisions) + 1 + 1/2)/divisions
+    grad_colors = _lerp((np.arange(divisions) + 1/2)/divisions,
+        to_rgba(color1), to_rgba(color2))
+    for start_point1, end_point1, start_point2, end_point2, grad_color in zip(
+        _lerp(start_fracs, *line1_endpoints),
+        _lerp(end_fracs, *line1_endpoints),
+        _lerp(start_fracs, *line2_endpoints),
+        _lerp(end_fracs, *line2_endpoints),
+        grad_colors):
         grad.append(geom.polygon(
             [start_point1, end_point1, end_point2, start_point2],
             draw_options={'facecolor': grad_color, **draw_options}))
@@ -222,17 +238,19 @@ def lateral_gradient_ribbon(direction, point1, point2, color1, color2,
     draw_options.pop('facecolor', None)
     draw_options.pop('edgecolor', None)
 
-    # Color gradient calculator for the given points and colors
-    def this_colorgrad(x):
-        return _calc_colorgrad(x, point1, point2, color1, color2)
+    # Interpolate the band edges and colors all at once
+    start_points = _lerp(np.arange(divisions)/divisions, point1, point2)
+    # Overlap bands by half a division, except the last one
+    end_points = _lerp(
+        np.minimum((np.arange(divisions) + 1 + 1/2)/divisions, 1),
+        point1, point2)
+    grad_colors = _lerp((np.arange(divisions) + 1/2)/divisions,
+        to_rgba(color1), to_rgba(color2))
 
     grad = geom.Collection()
     # Ribbons comprising the color gradient, as we move from point1 to point2
-    for i in range(divisions):
-        start_point, _ = this_colorgrad(i/divisions)
-        # Overlap bands by half a division, except the last one
-        end_point, _ = this_colorgrad(min((i+1+1/2)/divisions, 1))
-        _, grad_color = this_colorgrad((i+1/2)/divisions)
+    for start_point, end_point, grad_color in zip(
+        start_points, end_points, grad_colors):
         # Explicitly turn off edge coloring
         grad.append(geom.Ribbon(
             geom.Line(direction, start_point),
@@ -110,7 +110,10 @@ class MovingObject(geom.Ribbon):
     def _pos_at_time(line, time):
         """Returns position of an object (represented by a line) at a given
         time."""
-        return line.intersect(geom.fixedtime(time)).x
+        # Solve for the intersection with the line of constant time directly,
+        # rather than constructing that line
+        direc, point = line.direction(), line.point()
+        return point.x + (time - point.t) * direc.x / direc.t
 
     @staticmethod
     def _time_for_pos(line, pos):
@@ -119,7 +122,8 @@ class MovingObject(geom.Ribbon):
         # Throw an error if the object isn't moving
         if line.slope() is None:
             raise RuntimeError('Object is not moving.')
-        return line.intersect(geom.fixedspace(pos)).t
+        direc, point = line.direction(), line.point()
+        return point.t + (pos - point.x) * direc.t / direc.x
 
     def left_pos(self, time):
         """Returns the left end position at some time.
@@ -272,7 +276,10 @@ class TimeInterval(geom.Ribbon):
     def _time_at_pos(line, position):
         """Returns the time value of an event (represented by a line) at a given
         position."""
-        return line.intersect(geom.fixedspace(position)).t
+        # Solve for the intersection with the line of constant position
+        # directly, rather than constructing that line
+        direc, point = line.direction(), line.point()
+        return point.t + (position - point.x) * direc.t / direc.x
 
     def start_time(self, position):
         """Returns start time at some position.
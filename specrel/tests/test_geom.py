@@ -1,8 +1,34 @@
+import copy
+import pickle
 import unittest
 
+import numpy as np
+
 import specrel.geom as geom
 from specrel.graphics.basegraph import STPlotter
 
+class _CustomTransformable(geom.LorentzTransformable):
+    """User-defined transformable with its own transformation logic, and no
+    _transform_leaves() override"""
+    def __init__(self):
+        super().__init__(tag=None, draw_options={})
+        self.velocities = []
+
+    def lorentz_transform(self, velocity, origin=(0, 0)):
+        self.velocities.append(velocity)
+
+    def draw(self, plotter, tlim=(None, None), xlim=(None, None), **kwargs):
+        pass
+
+    def _auto_draw_lims(self):
+        return (None, None), (None, None)
+
+class _ReflectedSTVector(geom.STVector):
+    """STVector that overrides lorentz_transform()"""
+    def lorentz_transform(self, velocity, origin=(0, 0)):
+        super().lorentz_transform(velocity, origin)
+        self.x = -self.x
+
 class _MockSTPlotter(STPlotter):
     """Mock plotter for draw() methods.
 
@@ -87,6 +113,27 @@ class STVectorInitTests(unittest.TestCase):
     def test_init_invalid_nargs(self):
         self.assertRaises(TypeError, geom.STVector, 2, 3, 4)
 
+    def test_from_components(self):
+        stvec = geom.STVector._from_components(2, 3, precision=4)
+        self.assertEqual((stvec.t, stvec.x), (2, 3))
+        self.assertEqual(stvec.precision, 4)
+        self.assertIsNone(stvec.tag)
+        self.assertEqual(stvec.draw_options, {})
+
+    def test_copy(self):
+        stvec = geom.STVector(2, 3, tag='test', precision=4,
+            draw_options={'color': 'red'})
+        shallow = copy.copy(stvec)
+        deep = copy.deepcopy(stvec)
+        for copied in [shallow, deep]:
+            self.assertIsNot(copied, stvec)
+            self.assertEqual((copied.t, copied.x), (2, 3))
+            self.assertEqual(copied.tag, 'test')
+            self.assertEqual(copied.precision, 4)
+            self.assertEqual(copied.draw_options, {'color': 'red'})
+        self.assertIs(shallow.draw_options, stvec.draw_options)
+        self.assertIsNot(deep.draw_options, stvec.draw_options)
+
 class STVectorOverloadTests(unittest.TestCase):
     """Overloaded operators and special methods."""
     def test_getitem(self):
@@ -110,16 +157,38 @@ class STVectorOverloadTests(unittest.TestCase):
     def test_eq(self):
         self.assertEqual(geom.STVector(2, 3), (2, 3))
 
+    def test_eq_wrong_length(self):
+        self.assertNotEqual(geom.STVector(2, 3), (2, 3, 4))
+        self.assertNotEqual(geom.STVector(2, 3), (2,))
+        self.assertFalse(geom.STVector(2, 3) == (2, 3, 4))
+
+    def test_eq_non_iterable(self):
+        self.assertNotEqual(geom.STVector(2, 3), 2)
+
     def test_eq_within_precision(self):
         self.assertEqual(geom.STVector(2, 3, precision=3), (2.0001, 3))
         self.assertNotEqual(geom.STVector(2, 3, precision=3), (2.001, 3))
 
+    def test_eq_tolerance(self):
+        # Equal if within half a unit in the last decimal place, regardless of
+        # where rounding boundaries fall
+        self.assertEqual(geom.STVector(0.4, 0, precision=0),
+            geom.STVector(0.6, 0, precision=0))
+        self.assertEqual(geom.STVector(1.26, 0, precision=1), (1.3, 0))
+        self.assertNotEqual(geom.STVector(0.49, 0, precision=0),
+            geom.STVector(-0.49, 0, precision=0))
+        self.assertNotEqual(geom.STVector(1.24, 0, precision=1), (1.3, 0))
+
     def test_neg(self):
         self.assertEqual(-geom.STVector(2, 3), geom.STVector(-2, -3))
 
     def test_add(self):
         self.assertEqual(geom.STVector(2, 3) + geom.STVector(3, 3), (5, 6))
 
+    def test_sub(self):
+        self.assertEqual(geom.STVector(2, 3) - geom.STVector(3, 1), (-1, 2))
+        self.assertEqual(geom.STVector(2, 3) - (3, 1), (-1, 2))
+
     def test_abs(self):
         self.assertEqual(abs(geom.STVector(2, 3)), 5)
 
@@ -170,6 +239,15 @@ class STVectorCoreTests(unittest.TestCase):
         stvec2 = geom.STVector(2.001, 3.001, precision=3)
         self.assertFalse(stvec2._in_bounds((0, 2), (2, 3)))
 
+    def test_in_bounds_tolerance(self):
+        # In bounds if within half a unit in the last decimal place
+        self.assertTrue(
+            geom.STVector(1.45, 0, precision=0)._in_bounds((0, 1), (0, 0)))
+        self.assertFalse(
+            geom.STVector(1.55, 0, precision=0)._in_bounds((0, 1), (0, 0)))
+        self.assertTrue(
+            geom.STVector(-0.45, 0, precision=0)._in_bounds((0, 1), (0, 0)))
+
     def test_in_bounds_exact_equality(self):
         self.assertTrue(geom.STVector(2, 3)._in_bounds((2, 2), (3, 3)))
 
@@ -186,6 +264,12 @@ class STVectorCoreTests(unittest.TestCase):
     def test_gamma_factor_three_fifths(self):
         self.assertAlmostEqual(geom.STVector.gamma_factor(3/5), 5/4)
 
+    def test_gamma_factor_array(self):
+        gammas = geom.STVector.gamma_factor(np.array([0, 3/5, -4/5]))
+        self.assertEqual(len(gammas), 3)
+        for gamma, answer in zip(gammas, [1, 5/4, 5/3]):
+            self.assertAlmostEqual(gamma, answer)
+
 class test_lorentz_transformed(unittest.TestCase):
     def setUp(self):
         self.original = geom.STVector(2, 3)
@@ -200,6 +284,30 @@ class test_lorentz_transformed(unittest.TestCase):
         self.assertNotAlmostEqual(self.original[0], self.transformed[0])
         self.assertNotAlmostEqual(self.original[1], self.transformed[1])
 
+    def test_deep_copied_collection(self):
+        shared = geom.STVector(2, 3, draw_options={'color': 'red'})
+        original = geom.Collection([shared, shared])
+        transformed = geom.lorentz_transformed(original, 3/5)
+        # Shared references stay shared in the copy, but not with the original
+        self.assertIs(transformed[0], transformed[1])
+        self.assertIsNot(transformed[0], shared)
+        self.assertIsNot(transformed[0].draw_options, shared.draw_options)
+        self.assertEqual(shared, (2, 3))
+
+class test_compose_velocities(unittest.TestCase):
+    def test_compose_velocities(self):
+        self.assertEqual(geom.compose_velocities(), 0)
+        self.assertAlmostEqual(geom.compose_velocities(1/2, 1/2), 4/5)
+        self.assertAlmostEqual(geom.compose_velocities(3/5, -3/5), 0)
+        self.assertAlmostEqual(geom.compose_velocities(1, -1/2), 1)
+
+    def test_equivalent_transform(self):
+        point = geom.STVector(2, 3)
+        point.lorentz_transform(1/2, (1, 1))
+        point.lorentz_transform(-1/3, (1, 1))
+        self.assertEqual(point, geom.lorentz_transformed(geom.STVector(2, 3),
+            geom.compose_velocities(1/2, -1/3), (1, 1)))
+
 class CollectionTests(unittest.TestCase):
     def setUp(self):
         group = geom.PointGroup([(0, 1), (2, 3)])
@@ -252,6 +360,35 @@ class CollectionTests(unittest.TestCase):
         self.assertAlmostEqual(self.collection[2][1].point(),
             ribbon_transformed[1].point())
 
+    def test_lorentz_transform_origin_1_1(self):
+        collection = geom.Collection([geom.STVector(3, 4),
+            geom.Collection([geom.Line((2, 3), (3, 4))])])
+        collection.lorentz_transform(3/5, origin=(1, 1))
+        stvec = collection[0]
+        line = collection[1][0]
+        self.assertAlmostEqual(stvec.t, 1/4 + 1)
+        self.assertAlmostEqual(stvec.x, 9/4 + 1)
+        # Directions aren't shifted by the origin
+        self.assertAlmostEqual(line.direction().t, 1/4)
+        self.assertAlmostEqual(line.direction().x, 9/4)
+        self.assertAlmostEqual(line.point().t, 1/4 + 1)
+        self.assertAlmostEqual(line.point().x, 9/4 + 1)
+
+    def test_lorentz_transform_custom_transformable(self):
+        custom = _CustomTransformable()
+        collection = geom.Collection([geom.STVector(3, 4),
+            geom.Collection([custom])])
+        collection.lorentz_transform(3/5)
+        self.assertEqual(custom.velocities, [3/5])
+        self.assertAlmostEqual(collection[0], (1/4, 9/4))
+
+    def test_lorentz_transform_overridden(self):
+        collection = geom.Collection([geom.STVector(3, 4),
+            _ReflectedSTVector(3, 4)])
+        collection.lorentz_transform(3/5)
+        self.assertAlmostEqual(collection[0], (1/4, 9/4))
+        self.assertAlmostEqual(collection[1], (1/4, -9/4))
+
     def test_draw(self):
         p = _MockSTPlotter()
         self.collection.draw(p, tlim=(-5, 5), xlim=(-5, 5))
@@ -270,9 +407,43 @@ class CollectionTests(unittest.TestCase):
         self.assertEqual(p.tlim, (-5, 5))
         self.assertEqual(p.xlim, (-5, 5))
 
+    def test_draw_batched_lines(self):
+        p = _MockSTPlotter()
+        batches = []
+        p.draw_line_segments = lambda segments, **kwargs: batches.append(
+            (len(segments), kwargs))
+        geom.Collection([
+            geom.Line((0, 1), (0, 0), draw_options={'color': 'blue'}),
+            geom.Line((0, 1), (1, 0), draw_options={'color': 'blue'}),
+            geom.Line((0, 1), (2, 0), tag='tagged'),
+            geom.Line((1, 0), (0, 0), draw_options={'color': 'red'}),
+        ]).draw(p, tlim=(-5, 5), xlim=(-5, 5))
+        self.assertEqual(batches,
+            [(2, {'color': 'blue'}), (1, {'color': 'red'})])
+        self.assertEqual(len(p.segments), 1)
+        self.assertEqual(p.segments[0][2], 'tagged')
+
+    def test_draw_lines_without_color(self):
+        # Without a fixed color, each line is drawn separately
+        p = _MockSTPlotter()
+        p.draw_line_segments = lambda segments, **kwargs: self.fail('batched')
+        geom.Collection([
+            geom.Line((0, 1), (0, 0)),
+            geom.Line((0, 1), (1, 0)),
+            geom.Line((0, 1), (2, 0)),
+        ]).draw(p, tlim=(-5, 5), xlim=(-5, 5))
+        self.assertEqual(len(p.segments), 3)
+
     def test_auto_draw_lims(self):
         self.assertEqual(self.collection._auto_draw_lims(), ((0, 2), (-1, 4)))
 
+    def test_auto_draw_lims_nested_empty(self):
+        collection = geom.Collection([geom.Collection(), geom.STVector(1, 2),
+            geom.Collection()])
+        self.assertEqual(collection._auto_draw_lims(), ((1, 1), (2, 2)))
+        self.assertEqual(geom.Collection([geom.Collection()])._auto_draw_lims(),
+            ((None, None), (None, None)))
+
 class PointGroupTests(unittest.TestCase):
     def setUp(self):
         self.group = geom.PointGroup([(0, 0), (0, 1), (1, 0)], tag='test')
@@ -286,6 +457,11 @@ class PointGroupTests(unittest.TestCase):
         self.assertEqual(self.group[2].x, 0)
         self.assertEqual(self.group.mode, geom.PointGroup.POINT)
 
+    def test_auto_draw_lims(self):
+        self.assertEqual(self.group._auto_draw_lims(), ((0, 1), (0, 1)))
+        self.assertEqual(geom.PointGroup([])._auto_draw_lims(),
+            ((None, None), (None, None)))
+
     def test_draw(self):
         p = _MockSTPlotter()
         self.group.draw(p)
@@ -298,6 +474,37 @@ class PointGroupTests(unittest.TestCase):
         self.assertEqual(p.tlim, (0, 1))
         self.assertEqual(p.xlim, (0, 1))
 
+    def test_draw_batched_points(self):
+        p = _MockSTPlotter()
+        batches = []
+        p.draw_points = lambda points, **kwargs: batches.append(
+            ([tuple(pt) for pt in points], kwargs))
+        geom.PointGroup([
+            geom.STVector(0, 0),
+            geom.STVector(0, 1),
+            geom.STVector(1, 1, tag='tagged'),
+            geom.STVector(2, 2, draw_options={'color': 'blue'}),
+            geom.STVector(9, 9),
+        ], draw_options={'color': 'red'}).draw(p, tlim=(0, 5), xlim=(0, 5))
+        self.assertEqual(batches, [([(0, 0), (0, 1)], {'color': 'red'}),
+            ([(2, 2)], {'color': 'red'})])
+        self.assertEqual(p.points, [((1, 1), 'tagged', {'color': 'red'})])
+
+    def test_draw_points_without_color(self):
+        # Without a fixed color, each point is drawn separately
+        p = _MockSTPlotter()
+        p.draw_points = lambda points, **kwargs: self.fail('batched')
+        self.group.draw(p)
+        self.assertEqual(len(p.points), 3)
+
+    def test_draw_out_of_bounds(self):
+        p = _MockSTPlotter()
+        self.group[2].draw_options = {'color': 'red'}
+        self.group.draw(p, tlim=(0.5, 2), xlim=(-1, 1))
+        self.assertEqual(p.points, [((1, 0), None, {'color': 'red'})])
+        self.assertEqual(p.tlim, (0.5, 2))
+        self.assertEqual(p.xlim, (-1, 1))
+
     def test_draw_connect(self):
         self.group.mode = geom.PointGroup.CONNECT
         p = _MockSTPlotter()
@@ -310,6 +517,27 @@ class PointGroupTests(unittest.TestCase):
         self.assertEqual(p.tlim, (0, 1))
         self.assertEqual(p.xlim, (0, 1))
 
+    def test_draw_connect_untagged(self):
+        self.group.mode = geom.PointGroup.CONNECT
+        self.group.tag = None
+        p = _MockSTPlotter()
+        self.group.draw(p)
+        self.assertEqual(len(p.segments), 2)
+        p.segments_equal(self, p.segments[0], ((0, 0), (0, 1), None, {}))
+        p.segments_equal(self, p.segments[1], ((0, 1), (1, 0), None, {}))
+
+    def test_draw_connect_polyline(self):
+        # Only drawn as a single polyline if the color is fixed
+        self.group.mode = geom.PointGroup.CONNECT
+        p = _MockSTPlotter()
+        polylines = []
+        p.draw_polyline = lambda points, tag, **kwargs: polylines.append(
+            (len(points), tag, kwargs))
+        self.group.draw(p)
+        self.assertEqual(polylines, [])
+        self.group.draw(p, color='red')
+        self.assertEqual(polylines, [(3, 'test', {'color': 'red'})])
+
     def test_draw_polygon(self):
         self.group.mode = geom.PointGroup.POLYGON
         p = _MockSTPlotter()
@@ -568,6 +796,30 @@ class RayIntersectTests(unittest.TestCase):
         line = geom.Line((0, 1), (1, 0))
         self.assertIsNone(ray.intersect(line))
 
+class IntersectManyTests(unittest.TestCase):
+    def test_intersect_many(self):
+        lines1 = [geom.Line((1, 1), (0, 0)), geom.Line((1, 1), (0, 0)),
+            geom.Ray((0, 1), (0.5, -1)), geom.Ray((0, -1), (0.5, -1)),
+            geom.Line((0, 1), (1, 0))]
+        lines2 = [geom.Line((1, -1), (2, 0)), geom.Line((1, 1), (0, 1)),
+            geom.Line((1, 0), (0, 0)), geom.Line((1, 0), (0, 0)),
+            geom.Line((0, 2), (1, 1))]
+        intersections = geom.intersect_many(lines1, lines2)
+        self.assertEqual(intersections[0], (1, 1))
+        self.assertIsNone(intersections[1])
+        self.assertEqual(intersections[2], (0.5, 0))
+        self.assertIsNone(intersections[3])
+        self.assertIsInstance(intersections[4], geom.Line)
+        for ln1, ln2, intersection in zip(lines1, lines2, intersections):
+            self.assertEqual(ln1.intersect(ln2), intersection)
+
+    def test_empty(self):
+        self.assertEqual(geom.intersect_many([], []), [])
+
+    def test_mismatched_lengths(self):
+        self.assertRaises(ValueError, geom.intersect_many,
+            [geom.Line((1, 1), (0, 0))], [])
+
 class RibbonBasicTests(unittest.TestCase):
     """Basic functionality tests."""
     def test_init(self):
@@ -593,6 +845,15 @@ class RibbonBasicTests(unittest.TestCase):
         self.assertRaises(TypeError, geom.Line((0, 1), (2, 3)).append,
             geom.STVector(1, 1))
 
+    def test_pickle_after_draw(self):
+        ribbon = geom.Ribbon(geom.Line((0, 1), (2, 3)),
+            geom.Line((0, 1), (0, 0)))
+        ribbon.draw(_MockSTPlotter(), tlim=(-2, 3), xlim=(0, 1))
+        unpickled = pickle.loads(pickle.dumps(ribbon))
+        self.assertEqual(unpickled[0], ribbon[0])
+        self.assertEqual(unpickled[1], ribbon[1])
+        self.assertTrue(unpickled._point_inside(geom.STVector(1, 0)))
+
     def test_draw(self):
         p = _MockSTPlotter()
         ribbon = geom.Ribbon(geom.Line((0, 1), (2, 3)),
@@ -647,6 +908,16 @@ class RibbonBoundaryTests(unittest.TestCase):
         )
         self.assertTrue(ribbon._point_inside((0, 2)))
 
+    def test_point_inside_after_transform(self):
+        ribbon = geom.Ribbon(geom.Line((1, 1), (0, 2)),
+            geom.Line((1, 1), (0, 0)))
+        self.assertTrue(ribbon._point_inside((0, 1)))
+        # Moving the boundaries must not reuse stale boundary constants
+        ribbon[0].point().x = 6
+        ribbon[1].point().x = 4
+        self.assertFalse(ribbon._point_inside((0, 1)))
+        self.assertTrue(ribbon._point_inside((0, 5)))
+
 class RibbonGetVerticesTests(unittest.TestCase):
     def test_get_vertices_flat_lines(self):
         ribbon = geom.Ribbon(
@@ -736,6 +1007,13 @@ class RibbonGetVerticesTests(unittest.TestCase):
             ]
         )
 
+    def test_get_vertices_ribbon_out_of_bounds(self):
+        ribbon = geom.Ribbon(
+            geom.Line((1, 1), (3, 0)),
+            geom.Line((1, 1), (4, 0)),
+        )
+        self.assertEqual(ribbon._get_vertices((0, 2), (0, 2)), [])
+
 class HalfRibbonBasicTests(unittest.TestCase):
     """Basic functionality tests."""
     def test_init_error_on_antiparallel(self):
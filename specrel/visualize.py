@@ -276,6 +276,8 @@ def stanimate_with_worldline(lorentz_transformable,
     tlim_anim = _override_tlim(tlim_anim, tlim)
     tlim_worldline = _override_tlim(tlim_worldline, tlim)
 
+    # Drawing doesn't modify the object, so both subplots can share one copy
+    transformable = copy.deepcopy(lorentz_transformable)
     animator = canim.MultiTimeAnimator(
         [
             {
@@ -291,7 +293,7 @@ def stanimate_with_worldline(lorentz_transformable,
                     'current_time_style': current_time_style,
                     'current_time_color': current_time_color,
                 },
-                'transformable': copy.deepcopy(lorentz_transformable),
+                'transformable': transformable,
                 'draw_options': {'tlim': tlim_worldline, 'xlim': xlim,
                     **kwargs},
             },
@@ -303,7 +305,7 @@ def stanimate_with_worldline(lorentz_transformable,
                     'legend_loc': legend_loc,
                     'title': 'Actual Scene',
                 },
-                'transformable': copy.deepcopy(lorentz_transformable),
+                'transformable': transformable,
                 'draw_options': {'tlim': tlim_worldline, 'xlim': xlim,
                     **kwargs},
             },